@@ -0,0 +1,371 @@
+"""
+Argument validation and local repair of LLM tool calls against MCP input schemas.
+"""
+
+import difflib
+import hashlib
+import json
+import re
+from collections import Counter, OrderedDict
+from typing import List, Dict, Any, Callable, Optional, Tuple
+
+
+class ArgumentValidationError(ValueError):
+    """Raised when a tool call cannot be repaired into valid arguments."""
+
+    def __init__(self, tool: str, errors: List[str]):
+        self.tool = tool
+        self.errors = errors
+        super().__init__(f"Invalid arguments for tool '{tool}': {'; '.join(errors)}")
+
+
+class _Invalid(Exception):
+    """Internal signal that a value does not match a schema."""
+
+
+_INTEGER_PATTERN = re.compile(r"^[+-]?\d+$")
+
+
+def _check_integer(value: Any, coerce: bool) -> Tuple[Any, bool]:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value, False
+    if coerce:
+        if isinstance(value, float) and value.is_integer():
+            return int(value), True
+        if isinstance(value, str) and _INTEGER_PATTERN.match(value.strip()):
+            return int(value.strip()), True
+    raise _Invalid(f"expected integer, got {value!r}")
+
+
+def _check_number(value: Any, coerce: bool) -> Tuple[Any, bool]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value, False
+    if coerce and isinstance(value, str):
+        text = value.strip()
+        if _INTEGER_PATTERN.match(text):
+            return int(text), True
+        try:
+            return float(text), True
+        except ValueError:
+            pass
+    raise _Invalid(f"expected number, got {value!r}")
+
+
+def _check_string(value: Any, coerce: bool) -> Tuple[Any, bool]:
+    if isinstance(value, str):
+        return value, False
+    if coerce and isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value), True
+    raise _Invalid(f"expected string, got {value!r}")
+
+
+def _check_boolean(value: Any, coerce: bool) -> Tuple[Any, bool]:
+    if isinstance(value, bool):
+        return value, False
+    if coerce:
+        if isinstance(value, str) and value.strip().lower() in ("true", "false"):
+            return value.strip().lower() == "true", True
+        if isinstance(value, int) and value in (0, 1):
+            return bool(value), True
+    raise _Invalid(f"expected boolean, got {value!r}")
+
+
+def _check_json_container(expected: type, label: str) -> Callable[[Any, bool], Tuple[Any, bool]]:
+    def check(value: Any, coerce: bool) -> Tuple[Any, bool]:
+        if isinstance(value, expected):
+            return value, False
+        if coerce and isinstance(value, str):
+            try:
+                parsed = json.loads(value)
+            except json.JSONDecodeError:
+                pass
+            else:
+                if isinstance(parsed, expected):
+                    return parsed, True
+        raise _Invalid(f"expected {label}, got {value!r}")
+    return check
+
+
+def _check_null(value: Any, coerce: bool) -> Tuple[Any, bool]:
+    if value is None:
+        return value, False
+    if coerce and isinstance(value, str) and value.strip().lower() in ("null", "none"):
+        return None, True
+    raise _Invalid(f"expected null, got {value!r}")
+
+
+_TYPE_CHECKERS = {
+    "integer": _check_integer,
+    "number": _check_number,
+    "string": _check_string,
+    "boolean": _check_boolean,
+    "array": _check_json_container(list, "array"),
+    "object": _check_json_container(dict, "object"),
+    "null": _check_null,
+}
+
+
+def _compile_schema(schema: Dict[str, Any]) -> Callable[[Any, bool], Tuple[Any, bool]]:
+    """Compile a property schema into a checker returning (value, coerced)."""
+    branches = schema.get("anyOf") or schema.get("oneOf")
+    if branches:
+        compiled = [_compile_schema(branch) for branch in branches]
+
+        def check_any(value: Any, coerce: bool) -> Tuple[Any, bool]:
+            # Prefer a branch that accepts the value as-is over one that coerces it
+            for allow_coercion in ((False, True) if coerce else (False,)):
+                for branch in compiled:
+                    try:
+                        return branch(value, allow_coercion)
+                    except _Invalid:
+                        continue
+            raise _Invalid(f"{value!r} does not match any allowed type")
+        return check_any
+
+    schema_type = schema.get("type")
+    if isinstance(schema_type, list):
+        return _compile_schema({"anyOf": [dict(schema, type=t) for t in schema_type]})
+
+    type_check = _TYPE_CHECKERS.get(schema_type)
+    enum = schema.get("enum")
+
+    def check(value: Any, coerce: bool) -> Tuple[Any, bool]:
+        coerced = False
+        if type_check:
+            value, coerced = type_check(value, coerce)
+        if enum is not None and value not in enum:
+            raise _Invalid(f"{value!r} is not one of {enum}")
+        return value, coerced
+    return check
+
+
+def _is_read_only(tool: Any) -> bool:
+    annotations = getattr(tool, "annotations", None)
+    return bool(annotations is not None and annotations.readOnlyHint)
+
+
+def _normalize_name(name: str) -> str:
+    return re.sub(r"[\s_\-]", "", name).lower()
+
+
+class CompiledToolValidator:
+    """Validator for one tool, compiled once from its inputSchema."""
+
+    def __init__(self, name: str, input_schema: Optional[Dict[str, Any]], read_only: bool = False):
+        input_schema = input_schema or {}
+        self.name = name
+        # Only read-only tools may be reached through a misspelled tool name
+        self.read_only = read_only
+        self.properties = input_schema.get("properties", {})
+        self.required = set(input_schema.get("required", []))
+        self.allow_additional = input_schema.get("additionalProperties", True) is not False
+        self._checkers = {
+            param: _compile_schema(param_schema)
+            for param, param_schema in self.properties.items()
+        }
+        self._normalized_names = {_normalize_name(param): param for param in self.properties}
+
+    def validate(self, arguments: Dict[str, Any], coerce: bool = True) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Check arguments against the schema, repairing them where it is cheap.
+
+        Args:
+            arguments: Arguments produced by the LLM
+            coerce: Whether to attempt local repairs
+
+        Returns:
+            Tuple of (validated arguments, list of repair kinds applied)
+
+        Raises:
+            ArgumentValidationError: If the arguments cannot be repaired
+        """
+        repairs = []
+        errors = []
+        renamed = {}
+        unknown = {}
+
+        for key, value in arguments.items():
+            if key in self.properties:
+                renamed[key] = value
+            else:
+                unknown[key] = value
+
+        # Map near-miss parameter names onto unfilled schema properties
+        for key, value in unknown.items():
+            target = self._match_parameter(key, renamed) if coerce else None
+            if target is not None:
+                renamed[target] = value
+                repairs.append("rename")
+            elif self.allow_additional:
+                renamed[key] = value
+            elif coerce:
+                repairs.append("drop_unknown")
+            else:
+                errors.append(f"unexpected parameter '{key}'")
+
+        validated = {}
+        for key, value in renamed.items():
+            checker = self._checkers.get(key)
+            if checker is None:
+                validated[key] = value
+                continue
+            try:
+                validated[key], coerced = checker(value, coerce)
+            except _Invalid as e:
+                errors.append(f"parameter '{key}': {e}")
+                continue
+            if coerced:
+                repairs.append("coerce")
+
+        for param in sorted(self.required - renamed.keys()):
+            errors.append(f"missing required parameter '{param}'")
+
+        if errors:
+            raise ArgumentValidationError(self.name, errors)
+        return validated, repairs
+
+    def _match_parameter(self, key: str, filled: Dict[str, Any]) -> Optional[str]:
+        """Find the unfilled schema property a misspelled parameter name refers to."""
+        candidate = self._normalized_names.get(_normalize_name(key))
+        if candidate is not None and candidate not in filled:
+            return candidate
+
+        unfilled = [param for param in self.properties if param not in filled]
+        matches = difflib.get_close_matches(key, unfilled, n=1, cutoff=0.75)
+        return matches[0] if matches else None
+
+
+class ToolArgumentValidator:
+    """
+    Validates and repairs LLM tool calls against the tool catalog's input schemas.
+
+    Validators are compiled once per tool and cached per catalog version, so
+    listing an unchanged catalog again does not recompile anything.
+    Validation failures and repairs are counted for reporting.
+    """
+
+    def __init__(self, max_cached_catalogs: int = 4):
+        self.max_cached_catalogs = max_cached_catalogs
+        self._catalogs: "OrderedDict[str, Dict[str, CompiledToolValidator]]" = OrderedDict()
+        self.catalog_version: Optional[str] = None
+        self.validated = 0
+        self.validation_failures = 0
+        self.repairs = Counter()
+
+    @staticmethod
+    def compute_catalog_version(tools: List[Any]) -> str:
+        """Hash the names and input schemas of a tool catalog."""
+        catalog = sorted(
+            (tool.name, json.dumps(tool.inputSchema, sort_keys=True, default=str), _is_read_only(tool))
+            for tool in tools
+        )
+        return hashlib.sha256(json.dumps(catalog).encode("utf-8")).hexdigest()[:16]
+
+    def load_catalog(self, tools: List[Any]) -> str:
+        """
+        Make the given tools the active catalog, compiling validators if needed.
+
+        Args:
+            tools: MCP tools with name and inputSchema attributes
+
+        Returns:
+            The catalog version
+        """
+        version = self.compute_catalog_version(tools)
+        if version in self._catalogs:
+            self._catalogs.move_to_end(version)
+        else:
+            self._catalogs[version] = {
+                tool.name: CompiledToolValidator(tool.name, tool.inputSchema, _is_read_only(tool))
+                for tool in tools
+            }
+            while len(self._catalogs) > self.max_cached_catalogs:
+                self._catalogs.popitem(last=False)
+        self.catalog_version = version
+        return version
+
+    def validate_call(self, tool_call: Any, record: bool = True) -> Dict[str, Any]:
+        """
+        Validate one tool call from the LLM, repairing it where possible.
+
+        Args:
+            tool_call: A parsed tool call in any of the shapes the LLM produces
+            record: Whether to count the outcome in the validation statistics
+
+        Returns:
+            Dict with "name" and "args" of the validated call
+
+        Raises:
+            ArgumentValidationError: If the call cannot be repaired
+        """
+        repairs = []
+        try:
+            name, arguments = self._unwrap(tool_call, repairs)
+            validators = self._catalogs.get(self.catalog_version)
+            if validators is not None:
+                validator = validators.get(name)
+                if validator is None:
+                    # A misspelled name is only redirected to a tool without side effects
+                    read_only = [tool for tool, v in validators.items() if v.read_only]
+                    matches = difflib.get_close_matches(name, read_only, n=1, cutoff=0.8)
+                    if not matches:
+                        raise ArgumentValidationError(name, ["unknown tool"])
+                    validator = validators[matches[0]]
+                    name = validator.name
+                    repairs.append("rename_tool")
+                arguments, argument_repairs = validator.validate(arguments)
+                repairs.extend(argument_repairs)
+        except ArgumentValidationError:
+            if record:
+                self.validated += 1
+                self.validation_failures += 1
+            raise
+
+        if record:
+            self.validated += 1
+            self.repairs.update(repairs)
+        return {"name": name, "args": arguments}
+
+    def _unwrap(self, tool_call: Any, repairs: List[str]) -> Tuple[str, Dict[str, Any]]:
+        """Extract the tool name and arguments from the shapes the LLM produces."""
+        if not isinstance(tool_call, dict):
+            raise ArgumentValidationError(str(tool_call), ["tool call is not an object"])
+
+        name = tool_call.get("tool", tool_call.get("name"))
+        arguments = tool_call.get("arguments", tool_call.get("parameters", tool_call.get("args")))
+        # {"tool": ..., "arguments": ...} and its nested "function" form are the expected shapes
+        if "tool" not in tool_call or ("arguments" not in tool_call and arguments is not None):
+            repairs.append("unwrap")
+
+        # {"function": {"name": ..., "arguments": ...}}
+        if name is None and isinstance(tool_call.get("function"), dict):
+            function = tool_call["function"]
+            name = function.get("name")
+            arguments = function.get("arguments", function.get("parameters"))
+
+        # {"tool": "function", "arguments": {"function": ..., "arguments": {...}}}
+        if name == "function" and isinstance(arguments, dict) and "function" in arguments:
+            name = arguments.get("function")
+            arguments = arguments.get("arguments", {})
+
+        if isinstance(arguments, str):
+            try:
+                arguments = json.loads(arguments) if arguments.strip() else {}
+            except json.JSONDecodeError:
+                raise ArgumentValidationError(str(name), ["arguments are not valid JSON"])
+            repairs.append("coerce")
+
+        if arguments is None:
+            arguments = {}
+        if not isinstance(name, str) or not name:
+            raise ArgumentValidationError(str(name), ["missing tool name"])
+        if not isinstance(arguments, dict):
+            raise ArgumentValidationError(name, ["arguments are not an object"])
+        return name, arguments
+
+    def __str__(self):
+        repairs = ", ".join(f"{kind}={count}" for kind, count in sorted(self.repairs.items())) or "none"
+        return (
+            f"validated={self.validated}, failures={self.validation_failures}, "
+            f"repairs: {repairs}"
+        )
@@ -1,6 +1,6 @@
 import sys
 import os
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple
 
 # Add the parent directory to sys.path for direct execution
 if __name__ == "__main__":
@@ -15,15 +15,19 @@ try:
     from .prompt_builder import ChatPromptBuilder
     from .response_parser import RegexResponseParser
     from .tool_formatter import MCPToolFormatter
-    from .mcp_tool_selector import MCPToolSelector
-    from .interfaces import ExecutorInterface, PromptBuilderInterface, ResponseParserInterface, ToolFormatterInterface
+    from .mcp_tool_selector import MCPToolSelector, DEFAULT_PROFILE
+    from .interfaces import ExecutorInterface, PromptBuilderInterface, ResponseParserInterface, ToolFormatterInterface, execute_prompt
+    from .deadline import Deadline
+    from .genie_profiles import GenieProfileRegistry
 except ImportError:
     from cli.cli_executor import CLIExecutor
     from cli.prompt_builder import ChatPromptBuilder
     from cli.response_parser import RegexResponseParser
     from cli.tool_formatter import MCPToolFormatter
-    from cli.mcp_tool_selector import MCPToolSelector
-    from cli.interfaces import ExecutorInterface, PromptBuilderInterface, ResponseParserInterface, ToolFormatterInterface
+    from cli.mcp_tool_selector import MCPToolSelector, DEFAULT_PROFILE
+    from cli.interfaces import ExecutorInterface, PromptBuilderInterface, ResponseParserInterface, ToolFormatterInterface, execute_prompt
+    from cli.deadline import Deadline
+    from cli.genie_profiles import GenieProfileRegistry
 
 
 class LLMClient:
@@ -36,10 +40,12 @@ class LLMClient:
                  executor: Optional[ExecutorInterface] = None,
                  prompt_builder: Optional[PromptBuilderInterface] = None,
                  response_parser: Optional[ResponseParserInterface] = None,
-                 tool_formatter: Optional[ToolFormatterInterface] = None):
+                 tool_formatter: Optional[ToolFormatterInterface] = None,
+                 profiles: Optional[GenieProfileRegistry] = None,
+                 tool_selection_profile: Optional[str] = "tool_selection"):
         
         # Initialize components with dependency injection capability
-        self.executor = executor or CLIExecutor(exe_path, config_file, cwd)
+        self.executor = executor or CLIExecutor(exe_path, config_file, cwd, profiles)
         self.prompt_builder = prompt_builder or ChatPromptBuilder()
         self.response_parser = response_parser or RegexResponseParser()
         self.tool_formatter = tool_formatter or MCPToolFormatter()
@@ -49,30 +55,106 @@ class LLMClient:
             self.executor,
             self.prompt_builder,
             self.response_parser,
-            self.tool_formatter
+            self.tool_formatter,
+            tool_selection_profile
         )
         
     def build_prompt(self, user_message: str) -> str:
         """Build a chat prompt from user message."""
         return self.prompt_builder.build_chat_prompt(user_message)
 
-    def ask(self, prompt: str) -> str:
-        """Send the prompt to the LLM and return extracted response."""
-        raw_response = self.executor.execute(prompt)
+    def ask(self, prompt: str, deadline: Optional[Deadline] = None, profile: Optional[str] = None) -> str:
+        """Send the prompt to the LLM and return extracted response, optionally with a config profile."""
+        raw_response = execute_prompt(self.executor, prompt, deadline, profile)
         return self.response_parser.extract_content(raw_response)
 
-    def choose_mcp_tools(self, user_request: str, available_tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def choose_mcp_tools(self, 
+                         user_request: str, 
+                         available_tools: List[Dict[str, Any]],
+                         deadline: Optional[Deadline] = None,
+                         profile: Optional[str] = DEFAULT_PROFILE) -> List[Dict[str, Any]]:
         """
         Ask the LLM to choose which MCP server tools are needed for a given user request.
         
         Args:
             user_request: The user's request/query
             available_tools: List of available MCP tools with their descriptions and schemas
+            deadline: Optional deadline for the whole selection
+            profile: Executor configuration profile, defaults to the tool selection profile;
+                None selects the base configuration
             
         Returns:
             List of tools that should be called with their arguments
         """
-        return self.tool_selector.select_tools(user_request, available_tools)
+        return self.tool_selector.select_tools(user_request, available_tools, deadline, profile)
+
+    def choose_mcp_tools_with_content(self, 
+                                      user_request: str, 
+                                      available_tools: List[Dict[str, Any]],
+                                      deadline: Optional[Deadline] = None,
+                                      profile: Optional[str] = DEFAULT_PROFILE) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Choose MCP server tools and also return the LLM content they were parsed from.
+        
+        Args:
+            user_request: The user's request/query
+            available_tools: List of available MCP tools with their descriptions and schemas
+            deadline: Optional deadline for the whole selection
+            profile: Executor configuration profile, defaults to the tool selection profile;
+                None selects the base configuration
+            
+        Returns:
+            Tuple of (tools that should be called, extracted LLM content)
+        """
+        return self.tool_selector.select_tools_with_content(user_request, available_tools, deadline, profile)
+
+    def choose_mcp_tools_streaming(self, 
+                                   user_request: str, 
+                                   available_tools: List[Dict[str, Any]],
+                                   on_tool_call: Optional[Callable[[Dict[str, Any]], None]] = None,
+                                   deadline: Optional[Deadline] = None,
+                                   profile: Optional[str] = DEFAULT_PROFILE) -> List[Dict[str, Any]]:
+        """
+        Choose MCP server tools while reporting tool calls as they are decoded.
+        
+        Args:
+            user_request: The user's request/query
+            available_tools: List of available MCP tools with their descriptions and schemas
+            on_tool_call: Called with {"name": ..., "args": ...} for each tool call that
+                is complete in the partially decoded output
+            deadline: Optional deadline for the whole selection
+            profile: Executor configuration profile, defaults to the tool selection profile;
+                None selects the base configuration
+            
+        Returns:
+            List of tools that should be called with their arguments
+        """
+        return self.tool_selector.select_tools_streaming(user_request, available_tools, on_tool_call, deadline, profile)
+
+    def choose_mcp_tools_streaming_with_content(self, 
+                                                user_request: str, 
+                                                available_tools: List[Dict[str, Any]],
+                                                on_tool_call: Optional[Callable[[Dict[str, Any]], None]] = None,
+                                                deadline: Optional[Deadline] = None,
+                                                profile: Optional[str] = DEFAULT_PROFILE) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Choose MCP server tools while streaming, and also return the LLM content they were parsed from.
+        
+        Args:
+            user_request: The user's request/query
+            available_tools: List of available MCP tools with their descriptions and schemas
+            on_tool_call: Called with {"name": ..., "args": ...} for each tool call that
+                is complete in the partially decoded output
+            deadline: Optional deadline for the whole selection
+            profile: Executor configuration profile, defaults to the tool selection profile;
+                None selects the base configuration
+            
+        Returns:
+            Tuple of (tools that should be called, extracted LLM content)
+        """
+        return self.tool_selector.select_tools_streaming_with_content(
+            user_request, available_tools, on_tool_call, deadline, profile
+        )
     
     
 
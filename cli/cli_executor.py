@@ -2,9 +2,16 @@
 CLI executor implementation for running external LLM executables.
 """
 
+import codecs
+import os
+import signal
 import subprocess
-from typing import Optional
+import tempfile
+import threading
+from typing import Iterator, Optional
 from .interfaces import ExecutorInterface
+from .deadline import Deadline, DeadlineExceededError
+from .genie_profiles import GenieProfileRegistry
 
 
 class CLIExecutor(ExecutorInterface):
@@ -12,42 +19,151 @@ class CLIExecutor(ExecutorInterface):
     
     def __init__(self, exe_path: str = "./genie_bundle/genie-t2t-run.exe", 
                  config_file: str = "genie_bundle/genie_config.json", 
-                 cwd: Optional[str] = None):
+                 cwd: Optional[str] = None,
+                 profiles: Optional[GenieProfileRegistry] = None):
         self.exe_path = exe_path
         self.config_file = config_file
         self.cwd = cwd
+        self.profiles = profiles or GenieProfileRegistry(config_file, cwd=cwd)
     
-    def execute(self, prompt: str) -> str:
-        """Execute the CLI command with the given prompt."""
-        print("Calling LLM with prompt:")
-        print(prompt)
-
-        command = [
+    def _build_command(self, prompt: str, profile: Optional[str] = None) -> list:
+        """Build the command line for the given prompt and configuration profile."""
+        config_file = self.profiles.config_path(profile) if profile else self.config_file
+        return [
             self.exe_path,
             "-c",
-            self.config_file,
+            config_file,
             "-p",
             prompt,
         ]
 
-        try:
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                check=True,
-                cwd=self.cwd,
-            )
-            return result.stdout
+    def _spawn(self, command: list, **kwargs) -> subprocess.Popen:
+        """Start the executable in its own process group so it can be killed as a whole."""
+        if os.name == "nt":
+            kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            kwargs["start_new_session"] = True
 
+        try:
+            return subprocess.Popen(command, cwd=self.cwd, **kwargs)
         except FileNotFoundError:
             raise FileNotFoundError(f"Executable not found at {self.exe_path}")
 
-        except subprocess.CalledProcessError as e:
+    def _kill_process_group(self, process: subprocess.Popen) -> None:
+        """Kill the executable together with any child processes it started."""
+        if process.poll() is not None:
+            return
+        try:
+            if os.name == "nt":
+                subprocess.run(
+                    ["taskkill", "/F", "/T", "/PID", str(process.pid)],
+                    capture_output=True,
+                )
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except (OSError, subprocess.SubprocessError):
+            process.kill()
+
+    def execute(self, prompt: str, deadline: Optional[Deadline] = None, 
+                profile: Optional[str] = None) -> str:
+        """Execute the CLI command with the given prompt."""
+        print("Calling LLM with prompt:")
+        print(prompt)
+
+        if deadline:
+            deadline.check("executor")
+
+        command = self._build_command(prompt, profile)
+        process = self._spawn(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+        try:
+            stdout, stderr = process.communicate(
+                timeout=deadline.remaining() if deadline else None
+            )
+        except subprocess.TimeoutExpired:
+            self._kill_process_group(process)
+            process.communicate()
+            raise DeadlineExceededError("executor", deadline.timeout)
+        except BaseException:
+            self._kill_process_group(process)
+            raise
+
+        if process.returncode != 0:
             # Return stdout even on failure for potential response extraction
-            if e.stdout:
-                return e.stdout
+            if stdout:
+                return stdout
             raise RuntimeError(
-                f"Command failed with exit code {e.returncode}\n"
-                f"stdout:\n{e.stdout}\nstderr:\n{e.stderr}"
-            )
\ No newline at end of file
+                f"Command failed with exit code {process.returncode}\n"
+                f"stdout:\n{stdout}\nstderr:\n{stderr}"
+            )
+        return stdout
+
+    def execute_stream(self, prompt: str, deadline: Optional[Deadline] = None, 
+                       profile: Optional[str] = None, chunk_size: int = 256) -> Iterator[str]:
+        """Execute the CLI command and yield stdout chunks while the model is decoding."""
+        print("Calling LLM (streaming) with prompt:")
+        print(prompt)
+
+        if deadline:
+            deadline.check("executor")
+
+        command = self._build_command(prompt, profile)
+
+        # stderr goes to a temporary file so a chatty child cannot block on a full pipe
+        with tempfile.TemporaryFile() as stderr_file:
+            process = self._spawn(command, stdout=subprocess.PIPE, stderr=stderr_file)
+
+            # Reads block, so a watchdog kills the process group when the deadline expires
+            timed_out = threading.Event()
+            watchdog = None
+            if deadline:
+                def on_deadline():
+                    timed_out.set()
+                    self._kill_process_group(process)
+
+                watchdog = threading.Timer(deadline.remaining(), on_deadline)
+                watchdog.daemon = True
+                watchdog.start()
+
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            received_output = False
+            finished = False
+            try:
+                while True:
+                    data = os.read(process.stdout.fileno(), chunk_size)
+                    if not data:
+                        break
+                    text = decoder.decode(data)
+                    if text:
+                        received_output = True
+                        yield text
+                tail = decoder.decode(b"", final=True)
+                if tail:
+                    received_output = True
+                    yield tail
+                finished = True
+            finally:
+                if watchdog:
+                    watchdog.cancel()
+                process.stdout.close()
+                # Stop the model if the consumer closed the stream early
+                if not finished:
+                    self._kill_process_group(process)
+                returncode = process.wait()
+
+            if timed_out.is_set():
+                raise DeadlineExceededError("executor", deadline.timeout)
+
+            # Mirror execute(): a failing run is only an error if it produced no output
+            if returncode != 0 and not received_output:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode("utf-8", errors="replace")
+                raise RuntimeError(
+                    f"Command failed with exit code {returncode}\n"
+                    f"stderr:\n{stderr}"
+                )
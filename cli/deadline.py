@@ -0,0 +1,50 @@
+"""
+Per-request deadlines shared by prompt building, the executor and MCP calls.
+"""
+
+import time
+from typing import Optional
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when a request runs out of time, reporting the stage that was running."""
+
+    def __init__(self, stage: str, timeout: Optional[float] = None):
+        self.stage = stage
+        self.timeout = timeout
+        message = f"Deadline exceeded during {stage}"
+        if timeout is not None:
+            message += f" (timeout {timeout:.1f}s)"
+        super().__init__(message)
+
+
+class Deadline:
+    """An absolute point in time by which a request must complete."""
+
+    def __init__(self, expires_at: float, timeout: Optional[float] = None):
+        """
+        Args:
+            expires_at: Expiry time on the time.monotonic() clock
+            timeout: The original timeout in seconds, for error reporting
+        """
+        self.expires_at = expires_at
+        self.timeout = timeout
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """Create a deadline that expires the given number of seconds from now."""
+        return cls(time.monotonic() + seconds, seconds)
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline, never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return time.monotonic() >= self.expires_at
+
+    def check(self, stage: str) -> None:
+        """Raise DeadlineExceededError if the deadline has passed before the given stage."""
+        if self.expired:
+            raise DeadlineExceededError(stage, self.timeout)
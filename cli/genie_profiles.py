@@ -0,0 +1,170 @@
+"""
+Genie configuration profiles derived from the base genie_config.json.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+
+class GenieProfile:
+    """
+    A named set of overrides applied to the base Genie configuration.
+
+    Override keys are dotted paths below the "dialog" section, e.g.
+    "context.size", "sampler.temp" or "engine.backend.QnnHtp.use-mmap".
+    """
+
+    def __init__(self, name: str, overrides: Dict[str, Any], description: str = ""):
+        self.name = name
+        self.overrides = overrides
+        self.description = description
+
+    def apply(self, base_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a copy of the base configuration with the overrides applied."""
+        config = copy.deepcopy(base_config)
+        for path, value in self.overrides.items():
+            section = config["dialog"]
+            keys = path.split(".")
+            for key in keys[:-1]:
+                if not isinstance(section.get(key), dict):
+                    raise KeyError(f"Profile '{self.name}': no section '{key}' for override '{path}'")
+                section = section[key]
+            section[keys[-1]] = value
+        return config
+
+
+# Only "tool_selection" and "chat" are used by default. The other profiles
+# change engine or context settings the shipped config was not validated
+# with; select them explicitly, e.g. LLMClient(tool_selection_profile=...),
+# after checking that they load on the device. The context size must stay
+# within what the model's context binaries support.
+DEFAULT_PROFILES = (
+    GenieProfile(
+        "tool_selection",
+        {
+            "sampler.top-k": 1,
+        },
+        "Greedy, deterministic decoding for JSON tool calls",
+    ),
+    GenieProfile(
+        "chat",
+        {},
+        "The base configuration unchanged, for free-form answers",
+    ),
+    GenieProfile(
+        "tool_selection_mmap",
+        {
+            "sampler.top-k": 1,
+            "engine.backend.QnnHtp.use-mmap": True,
+        },
+        "Greedy decoding with memory-mapped context binaries (opt-in)",
+    ),
+    GenieProfile(
+        "tool_selection_short_context",
+        {
+            "sampler.top-k": 1,
+            "context.size": 2048,
+        },
+        "Greedy decoding with a 2048-token context (opt-in)",
+    ),
+)
+
+
+class GenieProfileRegistry:
+    """
+    Registry of configuration profiles that writes one config file per profile.
+
+    Derived files are named after the profile and a hash of their content and
+    are only written when no file with that hash exists yet, so unchanged
+    profiles reuse the file from earlier runs.
+    """
+
+    def __init__(self,
+                 base_config_file: str = "genie_bundle/genie_config.json",
+                 cache_dir: Optional[str] = None,
+                 cwd: Optional[str] = None,
+                 profiles: Iterable[GenieProfile] = DEFAULT_PROFILES):
+        """
+        Args:
+            base_config_file: The base Genie configuration, relative to cwd
+            cache_dir: Directory for derived configs, defaults to a "profiles"
+                folder next to the base configuration
+            cwd: Working directory the executable runs in
+            profiles: Profiles to register initially
+        """
+        self.cwd = cwd
+        self.base_config_file = base_config_file
+        self.cache_dir = cache_dir or os.path.join(os.path.dirname(base_config_file), "profiles")
+        self._profiles: Dict[str, GenieProfile] = {}
+        self._paths: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        for profile in profiles:
+            self.register(profile)
+
+    def register(self, profile: GenieProfile) -> None:
+        """Add or replace a profile."""
+        with self._lock:
+            self._profiles[profile.name] = profile
+            self._paths.pop(profile.name, None)
+
+    def get(self, name: str) -> GenieProfile:
+        """Look up a profile by name."""
+        try:
+            return self._profiles[name]
+        except KeyError:
+            raise KeyError(f"Unknown Genie profile '{name}'. Known profiles: {sorted(self._profiles)}")
+
+    def config_path(self, name: Optional[str] = None) -> str:
+        """
+        Get the configuration file to run a profile with.
+
+        Profiles without overrides run with the base configuration itself.
+
+        Args:
+            name: Profile name, or None for the base configuration
+
+        Returns:
+            Path of the configuration file, relative to cwd if the base path is
+        """
+        if name is None:
+            return self.base_config_file
+
+        profile = self.get(name)
+        if not profile.overrides:
+            return self.base_config_file
+        base_path = self._resolve(self.base_config_file)
+        base_mtime = os.path.getmtime(base_path)
+
+        with self._lock:
+            cached = self._paths.get(name)
+            if cached and cached[0] == base_mtime:
+                return cached[1]
+
+            with open(base_path, "r", encoding="utf-8") as f:
+                base_config = json.load(f)
+
+            content = json.dumps(profile.apply(base_config), indent=2)
+            digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+            path = os.path.join(self.cache_dir, f"genie_config.{name}.{digest}.json")
+
+            resolved = self._resolve(path)
+            if not os.path.exists(resolved):
+                os.makedirs(os.path.dirname(resolved), exist_ok=True)
+                # Write to a temporary file first so readers never see a partial config
+                temp_path = f"{resolved}.{os.getpid()}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    f.write(content)
+                os.replace(temp_path, resolved)
+
+            self._paths[name] = (base_mtime, path)
+            return path
+
+    def _resolve(self, path: str) -> str:
+        """Resolve a path the way the executable will, relative to cwd."""
+        if self.cwd and not os.path.isabs(path):
+            return os.path.join(self.cwd, path)
+        return path
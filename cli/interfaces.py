@@ -3,18 +3,95 @@ Abstract interfaces for LLM client components.
 These interfaces define contracts for different responsibilities.
 """
 
+import inspect
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Callable
+from .deadline import Deadline
 
 
 class ExecutorInterface(ABC):
     """Interface for executing commands and getting responses."""
     
     @abstractmethod
-    def execute(self, prompt: str) -> str:
-        """Execute a command with the given prompt and return raw output."""
+    def execute(self, prompt: str, deadline: Optional[Deadline] = None, 
+                profile: Optional[str] = None) -> str:
+        """
+        Execute a command with the given prompt and return raw output.
+        
+        The profile names the configuration to run with; executors without
+        configuration profiles ignore it.
+        Raises DeadlineExceededError if the deadline expires first.
+        Callers go through execute_prompt, so executors that only accept
+        the prompt keep working.
+        """
         pass
 
+    def execute_stream(self, prompt: str, deadline: Optional[Deadline] = None, 
+                       profile: Optional[str] = None) -> Iterator[str]:
+        """
+        Execute a command and yield raw output chunks as they are produced.
+        
+        Executors that cannot stream fall back to yielding the full output once.
+        """
+        yield execute_prompt(self, prompt, deadline, profile)
+
+
+def _supported_kwargs(method: Callable, deadline: Optional[Deadline],
+                      profile: Optional[str]) -> Dict[str, Any]:
+    """
+    Keyword arguments for an executor method, limited to the ones it accepts.
+
+    Executors written before deadlines and profiles were added only take the
+    prompt; they are still called, just without the options they cannot use.
+    """
+    kwargs = {}
+    if deadline is not None:
+        kwargs["deadline"] = deadline
+    if profile is not None:
+        kwargs["profile"] = profile
+    if not kwargs:
+        return kwargs
+
+    try:
+        parameters = inspect.signature(method).parameters
+    except (TypeError, ValueError):
+        return kwargs
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()):
+        return kwargs
+    return {name: value for name, value in kwargs.items() if name in parameters}
+
+
+def execute_prompt(executor: ExecutorInterface, prompt: str,
+                   deadline: Optional[Deadline] = None, profile: Optional[str] = None) -> str:
+    """Call executor.execute, passing deadline and profile only if the executor accepts them."""
+    kwargs = _supported_kwargs(executor.execute, deadline, profile)
+    output = executor.execute(prompt, **kwargs)
+    if deadline and "deadline" not in kwargs:
+        # The executor could not enforce the deadline itself
+        deadline.check("executor")
+    return output
+
+
+def execute_prompt_stream(executor: ExecutorInterface, prompt: str,
+                          deadline: Optional[Deadline] = None,
+                          profile: Optional[str] = None) -> Iterator[str]:
+    """Call executor.execute_stream, falling back to execute for executors that cannot stream."""
+    stream = getattr(executor, "execute_stream", None)
+    if stream is None:
+        return iter([execute_prompt(executor, prompt, deadline, profile)])
+    kwargs = _supported_kwargs(stream, deadline, profile)
+    chunks = stream(prompt, **kwargs)
+    if deadline and "deadline" not in kwargs:
+        # The executor could not enforce the deadline itself
+        return _checked_stream(chunks, deadline)
+    return chunks
+
+
+def _checked_stream(chunks: Iterator[str], deadline: Deadline) -> Iterator[str]:
+    """Yield the chunks, then check the deadline once the stream has ended."""
+    yield from chunks
+    deadline.check("executor")
+
 
 class PromptBuilderInterface(ABC):
     """Interface for building various types of prompts."""
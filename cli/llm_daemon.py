@@ -0,0 +1,679 @@
+"""
+Shared local LLM daemon.
+
+One daemon process owns the executor (and with it the loaded model) and
+serves many client processes over a local socket: a Unix domain socket
+path, or "tcp://127.0.0.1:<port>" on loopback TCP. Windows CPython has no
+Unix domain sockets in asyncio, so TCP is the default there. Messages are
+framed as a 4-byte big-endian length followed by a UTF-8 JSON body. Every
+request carries an id, and responses may arrive out of order, so a single
+connection can have many requests in flight.
+
+Requests:  {"id": 1, "op": "execute", "prompt": "...", "profile": null, "timeout": 30.0}
+Responses: {"id": 1, "ok": true, "result": ...}
+           {"id": 1, "ok": false, "error": {"type": "...", "message": "...", "stage": "..."}}
+
+Operations: execute, ask, select_tools, sample, health, stats.
+"""
+
+import sys
+import os
+
+# Add the parent directory to sys.path for direct execution
+if __name__ == "__main__":
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(current_dir)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+
+import argparse
+import asyncio
+import itertools
+import json
+import socket
+import stat
+import struct
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+# Try relative imports first (for package execution), then absolute imports (for direct execution)
+try:
+    from .call_llm import LLMClient
+    from .cli_executor import CLIExecutor
+    from .deadline import Deadline, DeadlineExceededError
+    from .interfaces import ExecutorInterface, execute_prompt
+    from .mcp_tool_selector import DEFAULT_PROFILE
+    from .trace_executor import ReplayExecutor
+except ImportError:
+    from cli.call_llm import LLMClient
+    from cli.cli_executor import CLIExecutor
+    from cli.deadline import Deadline, DeadlineExceededError
+    from cli.interfaces import ExecutorInterface, execute_prompt
+    from cli.mcp_tool_selector import DEFAULT_PROFILE
+    from cli.trace_executor import ReplayExecutor
+
+
+TCP_PREFIX = "tcp://"
+if hasattr(socket, "AF_UNIX"):
+    DEFAULT_ADDRESS = os.path.join(tempfile.gettempdir(), "mcp-llm-daemon.sock")
+else:
+    DEFAULT_ADDRESS = f"{TCP_PREFIX}127.0.0.1:47811"
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+_FRAME_HEADER = struct.Struct(">I")
+
+
+class DaemonError(RuntimeError):
+    """Raised when the daemon reports an error, cannot be reached or cannot start."""
+
+
+def parse_address(address: str) -> Tuple[str, Any]:
+    """
+    Split a daemon address into its transport and target.
+
+    Returns:
+        ("tcp", (host, port)) for "tcp://host:port", otherwise ("unix", path)
+    """
+    if address.startswith(TCP_PREFIX):
+        host, _, port = address[len(TCP_PREFIX):].rpartition(":")
+        if not host or not port.isdigit():
+            raise ValueError(f"Invalid TCP address {address!r}, expected tcp://host:port")
+        return "tcp", (host.strip("[]"), int(port))
+    if not hasattr(socket, "AF_UNIX"):
+        raise ValueError(f"Unix domain sockets are not available here, use {TCP_PREFIX}127.0.0.1:<port>")
+    return "unix", address
+
+
+def _set_nodelay(sock: Optional[socket.socket]) -> None:
+    """Send small frames immediately instead of waiting to batch them."""
+    if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+def encode_frame(message: Dict[str, Any]) -> bytes:
+    """Serialize a message into a length-prefixed frame."""
+    body = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    if len(body) > MAX_FRAME_SIZE:
+        raise ValueError(f"Frame of {len(body)} bytes exceeds the {MAX_FRAME_SIZE} byte limit")
+    return _FRAME_HEADER.pack(len(body)) + body
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Optional[Dict[str, Any]]:
+    """Read one frame from a stream, returning None at end of stream."""
+    try:
+        header = await reader.readexactly(_FRAME_HEADER.size)
+    except asyncio.IncompleteReadError:
+        return None
+    (length,) = _FRAME_HEADER.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise ValueError(f"Frame of {length} bytes exceeds the {MAX_FRAME_SIZE} byte limit")
+    return json.loads(await reader.readexactly(length))
+
+
+class StubExecutor(ExecutorInterface):
+    """Model backend for tests that answers every prompt with a fixed response."""
+
+    def __init__(self, response: str = "[]", delay: float = 0.0):
+        self.response = response
+        self.delay = delay
+
+    def execute(self, prompt: str, deadline: Optional[Deadline] = None,
+                profile: Optional[str] = None) -> str:
+        """Return the fixed response between the markers the response parser expects."""
+        if deadline:
+            deadline.check("executor")
+        if self.delay:
+            time.sleep(self.delay)
+        return f"[BEGIN]: {self.response} [END]"
+
+
+class LLMDaemon:
+    """
+    Serves LLM requests from many processes using a single executor.
+
+    Requests from all connections share one queue in front of the executor.
+    workers bounds how many requests reach the executor at once, which is
+    1 for a single NPU. The daemon does not authenticate clients, so TCP
+    addresses should stay on loopback.
+    """
+
+    def __init__(self, executor: ExecutorInterface, address: str = DEFAULT_ADDRESS,
+                 workers: int = 1):
+        self.address = address
+        self.workers = workers
+        self.llm_client = LLMClient(executor=executor)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm-daemon")
+        self._lock = threading.Lock()
+        self._server = None
+        # Unix socket path this daemon created and removes again on close
+        self._socket_path = None
+        self._started_at = time.monotonic()
+        self._stats = {
+            "connections": 0,
+            "queued": 0,
+            "running": 0,
+            "served": 0,
+            "errors": 0,
+            "timeouts": 0,
+            "busy_seconds": 0.0,
+            "ops": {},
+        }
+
+    async def start(self) -> None:
+        """
+        Start listening; a TCP port of 0 is replaced by the port actually bound.
+
+        Raises:
+            DaemonError: If another daemon already answers on the address, or
+                the Unix socket path is taken by something that is not a socket
+        """
+        transport, target = parse_address(self.address)
+        if transport == "tcp":
+            host, port = target
+            if port != 0 and self._address_in_use(transport, target):
+                raise DaemonError(f"Another LLM daemon is already listening on {self.address}")
+            self._server = await asyncio.start_server(self._handle_connection, host, port)
+            if port == 0:
+                port = self._server.sockets[0].getsockname()[1]
+                self.address = f"{TCP_PREFIX}{host}:{port}"
+        else:
+            if os.path.lexists(target):
+                if not stat.S_ISSOCK(os.lstat(target).st_mode):
+                    raise DaemonError(f"Refusing to replace {target}, it is not a socket")
+                if self._address_in_use(transport, target):
+                    raise DaemonError(f"Another LLM daemon is already listening on {self.address}")
+                # Left behind by a daemon that did not shut down cleanly
+                os.unlink(target)
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=target)
+            self._socket_path = target
+        print(f"LLM daemon listening on {self.address}")
+
+    @staticmethod
+    def _address_in_use(transport: str, target: Any) -> bool:
+        """Check whether something accepts connections on the address."""
+        family = socket.AF_UNIX if transport == "unix" else socket.AF_INET
+        if transport == "tcp" and ":" in target[0]:
+            family = socket.AF_INET6
+        with socket.socket(family, socket.SOCK_STREAM) as probe:
+            probe.settimeout(1.0)
+            try:
+                probe.connect(target)
+            except (ConnectionRefusedError, FileNotFoundError):
+                return False
+            except socket.timeout:
+                # Something holds the address but does not answer
+                return True
+        return True
+
+    async def serve_forever(self) -> None:
+        """Start the daemon and serve until cancelled."""
+        await self.start()
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop accepting connections and release the socket."""
+        if self._server is not None:
+            self._server.close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        if self._socket_path is not None:
+            if os.path.exists(self._socket_path):
+                os.unlink(self._socket_path)
+            self._socket_path = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue and throughput statistics."""
+        with self._lock:
+            stats = dict(self._stats, ops=dict(self._stats["ops"]))
+        stats["workers"] = self.workers
+        stats["uptime"] = time.monotonic() - self._started_at
+        stats["average_latency"] = stats["busy_seconds"] / stats["served"] if stats["served"] else 0.0
+        return stats
+
+    def health(self) -> Dict[str, Any]:
+        """Liveness information."""
+        return {
+            "status": "ok",
+            "pid": os.getpid(),
+            "executor": type(self.llm_client.executor).__name__,
+            "uptime": time.monotonic() - self._started_at,
+        }
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        with self._lock:
+            self._stats["connections"] += 1
+        _set_nodelay(writer.get_extra_info("socket"))
+        write_lock = asyncio.Lock()
+        pending = set()
+        try:
+            while True:
+                try:
+                    request = await read_frame(reader)
+                except (ValueError, ConnectionError) as e:
+                    print(f"Dropping connection: {e}")
+                    break
+                if request is None:
+                    break
+                # Each request runs on its own so responses can be sent out of order
+                task = asyncio.ensure_future(self._respond(request, writer, write_lock))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        finally:
+            for task in pending:
+                task.cancel()
+            with self._lock:
+                self._stats["connections"] -= 1
+            writer.close()
+
+    async def _respond(self, request: Any, writer: asyncio.StreamWriter,
+                       write_lock: asyncio.Lock) -> None:
+        request_id = request.get("id") if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict):
+                raise ValueError(f"Request must be a JSON object, got {type(request).__name__}")
+            response = {"id": request_id, "ok": True, "result": await self._dispatch(request)}
+            frame = encode_frame(response)
+        except Exception as e:
+            # Covers failed operations as well as results too large for one frame
+            frame = encode_frame(self._error_response(request_id, e))
+
+        async with write_lock:
+            try:
+                writer.write(frame)
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    def _error_response(request_id: Any, error: Exception) -> Dict[str, Any]:
+        return {
+            "id": request_id,
+            "ok": False,
+            "error": {
+                "type": type(error).__name__,
+                "message": str(error),
+                "stage": getattr(error, "stage", None),
+            },
+        }
+
+    async def _dispatch(self, request: Dict[str, Any]) -> Any:
+        op = request.get("op")
+        if op == "health":
+            return self.health()
+        if op == "stats":
+            return self.stats()
+
+        timeout = request.get("timeout")
+        deadline = Deadline.after(timeout) if timeout is not None else None
+        profile = request.get("profile")
+
+        if op == "execute":
+            call = lambda: execute_prompt(self.llm_client.executor, request["prompt"], deadline, profile)
+        elif op == "ask":
+            prompt = request.get("prompt") or self.llm_client.build_prompt(request["message"])
+            call = lambda: self.llm_client.ask(prompt, deadline, profile)
+        elif op == "select_tools":
+            call = lambda: self.llm_client.choose_mcp_tools(
+                request["user_request"], request["tools"], deadline,
+                request.get("profile", DEFAULT_PROFILE)
+            )
+        elif op == "sample":
+            message = "\n".join(request["messages"])
+            if request.get("system_prompt"):
+                message = f"{request['system_prompt']}\n\n{message}"
+            prompt = self.llm_client.build_prompt(message)
+            call = lambda: self.llm_client.ask(prompt, deadline, request.get("profile", "chat"))
+        else:
+            raise ValueError(f"Unknown operation: {op}")
+
+        return await self._run_on_executor(op, call)
+
+    async def _run_on_executor(self, op: str, call) -> Any:
+        """Queue a blocking call for the executor workers and record its statistics."""
+        with self._lock:
+            self._stats["queued"] += 1
+            self._stats["ops"][op] = self._stats["ops"].get(op, 0) + 1
+
+        def run():
+            with self._lock:
+                self._stats["queued"] -= 1
+                self._stats["running"] += 1
+            start = time.perf_counter()
+            outcome = "served"
+            try:
+                return call()
+            except DeadlineExceededError:
+                outcome = "timeouts"
+                raise
+            except Exception:
+                outcome = "errors"
+                raise
+            finally:
+                with self._lock:
+                    self._stats["running"] -= 1
+                    self._stats[outcome] += 1
+                    if outcome == "served":
+                        self._stats["busy_seconds"] += time.perf_counter() - start
+
+        def dequeue_cancelled(future):
+            # Requests cancelled before a worker picked them up never reach run()
+            if future.cancelled():
+                with self._lock:
+                    self._stats["queued"] -= 1
+
+        future = self._pool.submit(run)
+        future.add_done_callback(dequeue_cancelled)
+        return await asyncio.wrap_future(future)
+
+
+class DaemonExecutor(ExecutorInterface):
+    """
+    Executor that forwards prompts to a shared LLM daemon.
+
+    One connection is shared by all threads of the process; requests are
+    matched to responses by id, so concurrent calls do not wait for each other
+    on the client side.
+    """
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, connect_timeout: float = 5.0):
+        self.address = address
+        self.connect_timeout = connect_timeout
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._socket = None
+        # Request id -> [event, response, socket the request was sent on]
+        self._waiters: Dict[int, list] = {}
+
+    def _connect(self) -> socket.socket:
+        with self._lock:
+            if self._socket is not None:
+                return self._socket
+            transport, target = parse_address(self.address)
+            try:
+                if transport == "tcp":
+                    sock = socket.create_connection(target, timeout=self.connect_timeout)
+                    _set_nodelay(sock)
+                else:
+                    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    sock.settimeout(self.connect_timeout)
+                    try:
+                        sock.connect(target)
+                    except OSError:
+                        sock.close()
+                        raise
+            except OSError as e:
+                raise DaemonError(f"Cannot connect to LLM daemon at {self.address}: {e}")
+            sock.settimeout(None)
+            self._socket = sock
+            threading.Thread(target=self._read_responses, args=(sock,), daemon=True).start()
+            return sock
+
+    def _read_responses(self, sock: socket.socket) -> None:
+        """Deliver responses to the threads waiting for them."""
+        error = None
+        try:
+            while True:
+                header = self._recv_exact(sock, _FRAME_HEADER.size)
+                (length,) = _FRAME_HEADER.unpack(header)
+                response = json.loads(self._recv_exact(sock, length))
+                with self._lock:
+                    waiter = self._waiters.pop(response.get("id"), None)
+                if waiter is not None:
+                    waiter[1] = response
+                    waiter[0].set()
+        except (OSError, ValueError, ConnectionError) as e:
+            error = e
+        finally:
+            with self._lock:
+                if self._socket is sock:
+                    self._socket = None
+                waiters = [
+                    self._waiters.pop(request_id)
+                    for request_id, waiter in list(self._waiters.items())
+                    if waiter[2] is sock
+                ]
+            sock.close()
+            for waiter in waiters:
+                waiter[1] = {"ok": False, "error": {"type": "ConnectionError",
+                                                    "message": f"Connection to LLM daemon lost: {error}"}}
+                waiter[0].set()
+
+    @staticmethod
+    def _recv_exact(sock: socket.socket, size: int) -> bytes:
+        data = bytearray()
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("LLM daemon closed the connection")
+            data.extend(chunk)
+        return bytes(data)
+
+    def request(self, op: str, deadline: Optional[Deadline] = None, **params: Any) -> Any:
+        """
+        Send a request to the daemon and wait for its result.
+
+        Args:
+            op: The operation, e.g. "ask", "select_tools", "sample", "health" or "stats"
+            deadline: Optional deadline, forwarded to the daemon as a timeout
+            **params: Operation parameters
+
+        Returns:
+            The operation's result
+
+        Raises:
+            DeadlineExceededError: If the deadline expires in the daemon or while waiting
+            DaemonError: If the daemon reports an error or cannot be reached
+        """
+        if deadline:
+            deadline.check("daemon")
+            params["timeout"] = deadline.remaining()
+
+        request_id = next(self._ids)
+        sock = self._connect()
+        waiter = [threading.Event(), None, sock]
+        with self._lock:
+            if self._socket is not sock:
+                raise DaemonError("Connection to LLM daemon lost")
+            self._waiters[request_id] = waiter
+        try:
+            with self._send_lock:
+                sock.sendall(encode_frame(dict(params, id=request_id, op=op)))
+        except OSError as e:
+            with self._lock:
+                self._waiters.pop(request_id, None)
+            raise DaemonError(f"Failed to send request to LLM daemon: {e}")
+
+        if not waiter[0].wait(deadline.remaining() if deadline else None):
+            with self._lock:
+                self._waiters.pop(request_id, None)
+            raise DeadlineExceededError("daemon", deadline.timeout)
+
+        response = waiter[1]
+        if response.get("ok"):
+            return response.get("result")
+
+        error = response.get("error") or {}
+        if error.get("type") == "DeadlineExceededError":
+            raise DeadlineExceededError(error.get("stage") or "daemon", deadline.timeout if deadline else None)
+        raise DaemonError(f"LLM daemon error ({error.get('type')}): {error.get('message')}")
+
+    def execute(self, prompt: str, deadline: Optional[Deadline] = None,
+                profile: Optional[str] = None) -> str:
+        """Execute the prompt on the daemon's executor and return raw output."""
+        return self.request("execute", deadline, prompt=prompt, profile=profile)
+
+    def ask(self, message: str, deadline: Optional[Deadline] = None,
+            profile: Optional[str] = None) -> str:
+        """Build a chat prompt from the message on the daemon and return the extracted response."""
+        return self.request("ask", deadline, message=message, profile=profile)
+
+    def select_tools(self, user_request: str, tools: List[Dict[str, Any]],
+                     deadline: Optional[Deadline] = None,
+                     profile: Optional[str] = DEFAULT_PROFILE) -> List[Dict[str, Any]]:
+        """Let the daemon's LLM choose tools, with the daemon's tool selection profile by default."""
+        params = {"user_request": user_request, "tools": tools}
+        if profile is not DEFAULT_PROFILE:
+            params["profile"] = profile
+        return self.request("select_tools", deadline, **params)
+
+    def sample(self, messages: List[str], system_prompt: Optional[str] = None,
+               deadline: Optional[Deadline] = None, profile: Optional[str] = "chat") -> str:
+        """Answer a sampling request made of text messages and an optional system prompt."""
+        return self.request("sample", deadline, messages=messages, system_prompt=system_prompt,
+                            profile=profile)
+
+    def health(self) -> Dict[str, Any]:
+        """Get the daemon's health information."""
+        return self.request("health")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the daemon's queue and throughput statistics."""
+        return self.request("stats")
+
+    def close(self) -> None:
+        """Close the connection to the daemon."""
+        with self._lock:
+            sock, self._socket = self._socket, None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+
+
+def run_self_check(address: str = f"{TCP_PREFIX}127.0.0.1:0") -> bool:
+    """
+    Start a daemon with a stub backend and exercise every operation through DaemonExecutor.
+
+    Args:
+        address: Address to serve on; a TCP port of 0 picks a free port
+
+    Returns:
+        True if every check passed
+    """
+    response = '[{"tool": "function", "arguments": {"function": "add", "arguments": {"a": 1, "b": 2}}}]'
+    daemon = LLMDaemon(StubExecutor(response), address, workers=2)
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    startup_errors = []
+
+    def serve():
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(daemon.start())
+        except Exception as e:
+            startup_errors.append(e)
+            return
+        finally:
+            started.set()
+        loop.run_forever()
+        daemon.close()
+        # Run the callbacks that finish closing the connections
+        loop.run_until_complete(asyncio.sleep(0))
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    started.wait()
+    if startup_errors:
+        print(f"FAIL start: {startup_errors[0]}")
+        return False
+
+    client = DaemonExecutor(daemon.address)
+    tools = [{"name": "add", "description": "Add two numbers"}]
+
+    def concurrent_execute():
+        results = []
+        threads = [
+            threading.Thread(target=lambda i=i: results.append(client.execute(f"prompt {i}")))
+            for i in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return results == [f"[BEGIN]: {response} [END]"] * 8
+
+    checks = [
+        ("health", lambda: client.health()["executor"] == "StubExecutor"),
+        ("execute", lambda: client.execute("hello") == f"[BEGIN]: {response} [END]"),
+        ("ask", lambda: client.ask("hello") == response),
+        ("select_tools", lambda: client.select_tools("add 1 and 2", tools)[0]["arguments"]["function"] == "add"),
+        ("sample", lambda: client.sample(["hello"], system_prompt="Be brief.") == response),
+        ("concurrent execute", concurrent_execute),
+        ("deadline", lambda: _raises(DeadlineExceededError, client.execute, "hello", Deadline.after(0))),
+        ("stats", lambda: (lambda stats: stats["served"] == 12 and stats["queued"] == 0
+                           and stats["running"] == 0)(client.stats())),
+    ]
+
+    passed = True
+    try:
+        for name, check in checks:
+            try:
+                ok = check()
+            except Exception as e:
+                ok = False
+                print(f"FAIL {name}: {type(e).__name__}: {e}")
+            else:
+                print(f"{'ok  ' if ok else 'FAIL'} {name}")
+            passed = passed and ok
+    finally:
+        client.close()
+        # Give the daemon a moment to see the disconnect before its loop stops
+        wait_until = time.monotonic() + 2.0
+        while daemon.stats()["connections"] and time.monotonic() < wait_until:
+            time.sleep(0.01)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+    return passed
+
+
+def _raises(error: type, call, *args) -> bool:
+    try:
+        call(*args)
+    except error:
+        return True
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared local LLM daemon")
+    parser.add_argument("--address", default=DEFAULT_ADDRESS,
+                        help=f"Unix domain socket path or {TCP_PREFIX}127.0.0.1:<port>")
+    parser.add_argument("--exe", default="./genie_bundle/genie-t2t-run.exe", help="Genie executable")
+    parser.add_argument("--config", default="genie_bundle/genie_config.json", help="Base Genie configuration")
+    parser.add_argument("--cwd", default=None, help="Working directory for the executable")
+    parser.add_argument("--workers", type=int, default=1, help="Requests sent to the executor at once")
+    parser.add_argument("--trace", default=None, help="Serve responses from a recorded trace instead of the model")
+    parser.add_argument("--stub", default=None, help="Answer every prompt with this fixed response")
+    parser.add_argument("--self-check", action="store_true",
+                        help="Run every operation against a stub daemon on a free loopback port and exit")
+    args = parser.parse_args()
+
+    if args.self_check:
+        sys.exit(0 if run_self_check() else 1)
+
+    if args.stub is not None:
+        executor = StubExecutor(args.stub)
+    elif args.trace:
+        executor = ReplayExecutor(args.trace)
+    else:
+        executor = CLIExecutor(args.exe, args.config, args.cwd)
+
+    daemon = LLMDaemon(executor, args.address, args.workers)
+    try:
+        asyncio.run(daemon.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
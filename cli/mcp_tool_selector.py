@@ -2,8 +2,17 @@
 MCP tool selector implementation for orchestrating tool selection logic.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from .interfaces import ExecutorInterface, PromptBuilderInterface, ResponseParserInterface, ToolFormatterInterface
+from .interfaces import execute_prompt, execute_prompt_stream
+from .streaming_parser import IncrementalToolCallParser
+from .deadline import Deadline, DeadlineExceededError
+from .trace_executor import TraceMissError
+
+
+# Default for the profile arguments below: use the selector's own profile.
+# Passing None instead selects the base configuration.
+DEFAULT_PROFILE = object()
 
 
 class MCPToolSelector:
@@ -13,39 +22,177 @@ class MCPToolSelector:
                  executor: ExecutorInterface,
                  prompt_builder: PromptBuilderInterface, 
                  response_parser: ResponseParserInterface,
-                 tool_formatter: ToolFormatterInterface):
+                 tool_formatter: ToolFormatterInterface,
+                 profile: Optional[str] = "tool_selection"):
         self.executor = executor
         self.prompt_builder = prompt_builder
         self.response_parser = response_parser
         self.tool_formatter = tool_formatter
+        # Executor configuration profile used unless a call picks another one
+        self.profile = profile
     
-    def select_tools(self, user_request: str, available_tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def select_tools(self, 
+                     user_request: str, 
+                     available_tools: List[Dict[str, Any]],
+                     deadline: Optional[Deadline] = None,
+                     profile: Optional[str] = DEFAULT_PROFILE) -> List[Dict[str, Any]]:
         """
         Select appropriate tools for a user request using LLM.
         
         Args:
             user_request: The user's request/query
             available_tools: List of available MCP tools with their descriptions and schemas
+            deadline: Optional deadline for the whole selection
+            profile: Executor configuration profile, defaults to self.profile;
+                None selects the base configuration
             
         Returns:
             List of tools that should be called with their arguments
+            
+        Raises:
+            DeadlineExceededError: If the deadline expires before selection completes
+        """
+        tool_calls, _ = self.select_tools_with_content(user_request, available_tools, deadline, profile)
+        return tool_calls
+
+    def select_tools_with_content(self, 
+                                  user_request: str, 
+                                  available_tools: List[Dict[str, Any]],
+                                  deadline: Optional[Deadline] = None,
+                                  profile: Optional[str] = DEFAULT_PROFILE) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Select tools and also return the LLM content they were parsed from.
+        
+        The content lets callers tell an LLM that chose no tools apart from
+        output that could not be parsed at all.
+        
+        Args:
+            user_request: The user's request/query
+            available_tools: List of available MCP tools with their descriptions and schemas
+            deadline: Optional deadline for the whole selection
+            profile: Executor configuration profile, defaults to self.profile;
+                None selects the base configuration
+            
+        Returns:
+            Tuple of (tools that should be called, extracted LLM content)
+            
+        Raises:
+            DeadlineExceededError: If the deadline expires before selection completes
         """
         if not available_tools:
-            return []
+            return [], ""
         
         try:            
             # Build prompt for tool selection
+            if deadline:
+                deadline.check("prompt")
             prompt = self.prompt_builder.build_tool_selection_prompt(user_request, available_tools)
             
             # Execute and get raw response
-            raw_response = self.executor.execute(prompt)
+            raw_response = execute_prompt(self.executor, prompt, deadline, self._resolve_profile(profile))
             
             # Extract content from raw response
             content = self.response_parser.extract_content(raw_response)
             
             # Parse tool calls from content
-            return self.response_parser.parse_tool_calls(content)
+            return self.response_parser.parse_tool_calls(content), content
+            
+        except (DeadlineExceededError, TraceMissError, TypeError):
+            # A replay miss or a TypeError is a failure, not an empty selection
+            raise
+        except Exception as e:
+            print(f"Error in tool selection: {e}")
+            return [], ""
+
+    def select_tools_streaming(self, 
+                               user_request: str, 
+                               available_tools: List[Dict[str, Any]],
+                               on_tool_call: Optional[Callable[[Dict[str, Any]], None]] = None,
+                               deadline: Optional[Deadline] = None,
+                               profile: Optional[str] = DEFAULT_PROFILE) -> List[Dict[str, Any]]:
+        """
+        Select tools while streaming the LLM output.
+        
+        Args:
+            user_request: The user's request/query
+            available_tools: List of available MCP tools with their descriptions and schemas
+            on_tool_call: Called with {"name": ..., "args": ...} as soon as a tool call
+                is complete in the partially decoded output
+            deadline: Optional deadline for the whole selection
+            profile: Executor configuration profile, defaults to self.profile;
+                None selects the base configuration
+            
+        Returns:
+            List of tools parsed from the final output, as returned by select_tools
+            
+        Raises:
+            DeadlineExceededError: If the deadline expires before selection completes
+        """
+        tool_calls, _ = self.select_tools_streaming_with_content(
+            user_request, available_tools, on_tool_call, deadline, profile
+        )
+        return tool_calls
+
+    def select_tools_streaming_with_content(self, 
+                                            user_request: str, 
+                                            available_tools: List[Dict[str, Any]],
+                                            on_tool_call: Optional[Callable[[Dict[str, Any]], None]] = None,
+                                            deadline: Optional[Deadline] = None,
+                                            profile: Optional[str] = DEFAULT_PROFILE) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Select tools while streaming, and also return the LLM content they were parsed from.
+        
+        Args:
+            user_request: The user's request/query
+            available_tools: List of available MCP tools with their descriptions and schemas
+            on_tool_call: Called with {"name": ..., "args": ...} as soon as a tool call
+                is complete in the partially decoded output
+            deadline: Optional deadline for the whole selection
+            profile: Executor configuration profile, defaults to self.profile;
+                None selects the base configuration
             
+        Returns:
+            Tuple of (tools parsed from the final output, extracted LLM content)
+            
+        Raises:
+            DeadlineExceededError: If the deadline expires before selection completes
+        """
+        if not available_tools:
+            return [], ""
+        
+        try:
+            if deadline:
+                deadline.check("prompt")
+            prompt = self.prompt_builder.build_tool_selection_prompt(user_request, available_tools)
+            
+            # Report tool calls as soon as they are complete in the partial output
+            partial_parser = self._partial_parser()
+            chunks = execute_prompt_stream(self.executor, prompt, deadline, self._resolve_profile(profile))
+            for chunk in chunks:
+                for tool_call in partial_parser.feed(chunk):
+                    if on_tool_call:
+                        on_tool_call(tool_call)
+            
+            # The final parse is authoritative
+            content = self.response_parser.extract_content(partial_parser.raw_output)
+            return self.response_parser.parse_tool_calls(content), content
+            
+        except (DeadlineExceededError, TraceMissError, TypeError):
+            # A replay miss or a TypeError is a failure, not an empty selection
+            raise
         except Exception as e:
             print(f"Error in tool selection: {e}")
-            return []
\ No newline at end of file
+            return [], ""
+
+    def _resolve_profile(self, profile: Optional[str]) -> Optional[str]:
+        """Replace DEFAULT_PROFILE with the selector's profile."""
+        return self.profile if profile is DEFAULT_PROFILE else profile
+
+    def _partial_parser(self) -> IncrementalToolCallParser:
+        """Create an incremental parser that looks for the same markers as the response parser."""
+        markers = {}
+        for name in ("begin_marker", "end_marker"):
+            marker = getattr(self.response_parser, name, None)
+            if marker is not None:
+                markers[name] = marker
+        return IncrementalToolCallParser(**markers)
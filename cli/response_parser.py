@@ -12,6 +12,8 @@ class RegexResponseParser(ResponseParserInterface):
     """Parses responses using regex patterns to extract content."""
     
     def __init__(self, begin_marker: str = r"\[BEGIN\]:", end_marker: str = r"\[END\]"):
+        self.begin_marker = begin_marker
+        self.end_marker = end_marker
         self.content_pattern = re.compile(
             f"{begin_marker}\\s*(.*?){end_marker}", 
             re.DOTALL
@@ -31,8 +33,11 @@ class RegexResponseParser(ResponseParserInterface):
             # Clean up the response
             response = self._clean_json_response(response)
             
-            # Parse JSON
-            parsed = json.loads(response)
+            # Parse JSON, falling back to the first JSON value embedded in the text
+            try:
+                parsed = json.loads(response)
+            except json.JSONDecodeError:
+                parsed = self._extract_embedded_json(response)
             
             # Normalize to list format
             return self._normalize_tool_calls(parsed)
@@ -56,6 +61,18 @@ class RegexResponseParser(ResponseParserInterface):
         
         return response.strip()
     
+    def _extract_embedded_json(self, response: str) -> Any:
+        """Decode the first JSON object or array found in surrounding prose."""
+        decoder = json.JSONDecoder()
+        for match in re.finditer(r"[\[{]", response):
+            try:
+                parsed, _ = decoder.raw_decode(response, match.start())
+                return parsed
+            except json.JSONDecodeError:
+                continue
+        # Re-raise the original error for the caller to report
+        return json.loads(response)
+    
     def _normalize_tool_calls(self, parsed: Any) -> List[Dict[str, Any]]:
         """Normalize parsed JSON to consistent tool call format."""
         if isinstance(parsed, list):
@@ -0,0 +1,152 @@
+"""
+Incremental parser for tool-call JSON that is still being decoded by the LLM.
+"""
+
+import json
+import re
+from typing import List, Dict, Any, Optional
+
+
+class IncrementalToolCallParser:
+    """
+    Parses partially decoded tool-call JSON as chunks arrive.
+
+    The parser buffers raw executor output, waits for the begin marker and then
+    reports every tool call whose name is known and whose arguments object has
+    been fully closed. Each completed call is reported exactly once.
+    """
+
+    # Key injected into objects that had to be closed synthetically
+    _PARTIAL_KEY = "__partial__"
+
+    def __init__(self, begin_marker: str = r"\[BEGIN\]:", end_marker: str = r"\[END\]"):
+        self.begin_pattern = re.compile(begin_marker)
+        self.end_pattern = re.compile(end_marker)
+        self._buffer = ""
+        self._content_start: Optional[int] = None
+        self._last_close = -1
+        self._reported: List[Dict[str, Any]] = []
+
+    @property
+    def raw_output(self) -> str:
+        """All raw output fed into the parser so far."""
+        return self._buffer
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        Add a chunk of raw output and return newly completed tool calls.
+
+        Args:
+            chunk: Raw executor output
+
+        Returns:
+            List of {"name": ..., "args": ...} calls completed by this chunk
+        """
+        self._buffer += chunk
+
+        if self._content_start is None:
+            match = self.begin_pattern.search(self._buffer)
+            if not match:
+                return []
+            self._content_start = match.end()
+
+        content = self._buffer[self._content_start:]
+        end_match = self.end_pattern.search(content)
+        if end_match:
+            content = content[:end_match.start()]
+
+        # Only re-parse when a new object has been closed
+        last_close = content.rfind("}")
+        if last_close <= self._last_close:
+            return []
+        self._last_close = last_close
+
+        new_calls = []
+        for call in self._complete_calls(content[:last_close + 1]):
+            if call not in self._reported:
+                self._reported.append(call)
+                new_calls.append(call)
+        return new_calls
+
+    def _complete_calls(self, prefix: str) -> List[Dict[str, Any]]:
+        """Parse the prefix and return the calls whose arguments are complete."""
+        start = min((i for i in (prefix.find("{"), prefix.find("[")) if i != -1), default=-1)
+        if start == -1:
+            return []
+
+        closed = self._close_prefix(prefix[start:])
+        if closed is None:
+            return []
+
+        try:
+            parsed = json.loads(closed)
+        except json.JSONDecodeError:
+            return []
+
+        calls = parsed if isinstance(parsed, list) else [parsed]
+        complete = []
+        for call in calls:
+            normalized = self._normalize(call)
+            if normalized is not None:
+                complete.append(normalized)
+        return complete
+
+    def _close_prefix(self, prefix: str) -> Optional[str]:
+        """
+        Close every container left open in the prefix.
+
+        The prefix always ends right after a closing brace, so every open
+        container's last element is a complete value. Objects closed here are
+        tagged with the partial marker so they are never reported as complete.
+        """
+        stack = []
+        in_string = False
+        escaped = False
+        for char in prefix:
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char in "{[":
+                stack.append(char)
+            elif char in "}]":
+                if not stack:
+                    return None
+                stack.pop()
+
+        if in_string:
+            return None
+
+        closers = []
+        for opener in reversed(stack):
+            if opener == "{":
+                closers.append(f', "{self._PARTIAL_KEY}": true}}')
+            else:
+                closers.append("]")
+        return prefix + "".join(closers)
+
+    def _normalize(self, call: Any) -> Optional[Dict[str, Any]]:
+        """Convert a parsed call into {"name", "args"} if it is complete."""
+        if not isinstance(call, dict):
+            return None
+
+        name = call.get("tool")
+        args = call.get("arguments")
+        if not isinstance(args, dict):
+            return None
+
+        # Handle the nested format: {"tool": "function", "arguments": {"function": ..., "arguments": {...}}}
+        if name == "function":
+            name = args.get("function")
+            args = args.get("arguments")
+            if not isinstance(args, dict):
+                return None
+
+        if not isinstance(name, str) or not name or self._PARTIAL_KEY in args:
+            return None
+        return {"name": name, "args": args}
@@ -0,0 +1,260 @@
+"""
+Record/replay executors for testing the orchestration layer without the NPU.
+
+The trace file starts with a magic header followed by one record per call:
+
+    digest (16 bytes) | profile_len (u16) | prompt_len (u32) | output_len (u32) | duration (f64)
+    profile bytes | prompt bytes | output bytes
+
+The digest is computed over the profile and prompt, so replay lookups only
+need the fixed-size record headers to build the index.
+"""
+
+import difflib
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+from .interfaces import ExecutorInterface, execute_prompt, execute_prompt_stream
+from .deadline import Deadline, DeadlineExceededError
+
+
+TRACE_MAGIC = b"GTRACE1\n"
+_RECORD_HEADER = struct.Struct("<16sHIId")
+
+FALLBACK_ERROR = "error"
+FALLBACK_NEAREST = "nearest"
+
+
+class TraceMissError(LookupError):
+    """Raised when a prompt is not in the trace and no fallback is configured."""
+
+
+def trace_key(prompt: str, profile: Optional[str] = None) -> bytes:
+    """Compute the digest a prompt is indexed by."""
+    data = f"{profile or ''}\0{prompt}".encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _truncate_incomplete_record(trace_path: str) -> None:
+    """Cut off a partially written last record left behind by an interrupted recording."""
+    if not os.path.exists(trace_path):
+        return
+    with open(trace_path, "r+b") as f:
+        size = os.fstat(f.fileno()).st_size
+        magic = f.read(len(TRACE_MAGIC))
+        if size < len(TRACE_MAGIC) and TRACE_MAGIC.startswith(magic):
+            # Interrupted while writing the header
+            f.truncate(0)
+            return
+        if magic != TRACE_MAGIC:
+            raise ValueError(f"Not a trace file: {trace_path}")
+
+        offset = len(TRACE_MAGIC)
+        while offset + _RECORD_HEADER.size <= size:
+            f.seek(offset)
+            _, profile_len, prompt_len, output_len, _ = _RECORD_HEADER.unpack(f.read(_RECORD_HEADER.size))
+            end = offset + _RECORD_HEADER.size + profile_len + prompt_len + output_len
+            if end > size:
+                break
+            offset = end
+
+        if offset < size:
+            print(f"Truncating incomplete record at byte {offset} of {trace_path}")
+            f.truncate(offset)
+
+
+class RecordingExecutor(ExecutorInterface):
+    """Wraps an executor and appends every prompt and raw output to a trace file."""
+
+    def __init__(self, executor: ExecutorInterface, trace_path: str):
+        self.executor = executor
+        self.trace_path = trace_path
+        self._lock = threading.Lock()
+        _truncate_incomplete_record(trace_path)
+        self._file = open(trace_path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(TRACE_MAGIC)
+            self._file.flush()
+
+    def execute(self, prompt: str, deadline: Optional[Deadline] = None,
+                profile: Optional[str] = None) -> str:
+        """Execute with the wrapped executor and record the result."""
+        start = time.perf_counter()
+        output = execute_prompt(self.executor, prompt, deadline, profile)
+        self._record(prompt, profile, output, time.perf_counter() - start)
+        return output
+
+    def execute_stream(self, prompt: str, deadline: Optional[Deadline] = None,
+                       profile: Optional[str] = None) -> Iterator[str]:
+        """Stream from the wrapped executor, recording the output once the stream completes."""
+        start = time.perf_counter()
+        chunks = []
+        for chunk in execute_prompt_stream(self.executor, prompt, deadline, profile):
+            chunks.append(chunk)
+            yield chunk
+        self._record(prompt, profile, "".join(chunks), time.perf_counter() - start)
+
+    def _record(self, prompt: str, profile: Optional[str], output: str, duration: float) -> None:
+        profile_bytes = (profile or "").encode("utf-8")
+        prompt_bytes = prompt.encode("utf-8")
+        output_bytes = output.encode("utf-8")
+        header = _RECORD_HEADER.pack(
+            trace_key(prompt, profile), len(profile_bytes), len(prompt_bytes), len(output_bytes), duration
+        )
+        with self._lock:
+            self._file.write(header + profile_bytes + prompt_bytes + output_bytes)
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the trace file."""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ReplayExecutor(ExecutorInterface):
+    """
+    Serves recorded outputs from a memory-mapped trace file.
+
+    Replay runs as fast as possible by default; with realtime=True each call
+    takes as long as the recorded one (scaled by speed). Prompts missing from
+    the trace either raise TraceMissError or are answered with the output of
+    the most similar recorded prompt for the same profile.
+    """
+
+    def __init__(self, trace_path: str, realtime: bool = False, speed: float = 1.0,
+                 fallback: str = FALLBACK_ERROR, stream_chunk_size: int = 64):
+        if fallback not in (FALLBACK_ERROR, FALLBACK_NEAREST):
+            raise ValueError(f"Unknown fallback: {fallback}")
+        self.trace_path = trace_path
+        self.realtime = realtime
+        self.speed = speed
+        self.fallback = fallback
+        self.stream_chunk_size = stream_chunk_size
+        self.hits = 0
+        self.misses = 0
+        self.nearest_matches = 0
+
+        self._file = open(trace_path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < len(TRACE_MAGIC):
+            self._file.close()
+            raise ValueError(f"Not a trace file: {trace_path}")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(TRACE_MAGIC)] != TRACE_MAGIC:
+            self.close()
+            raise ValueError(f"Not a trace file: {trace_path}")
+
+        self._index: Dict[bytes, tuple] = {}
+        self._by_profile: Dict[str, List[tuple]] = {}
+        self._build_index()
+
+    def _build_index(self) -> None:
+        """Index records by digest, reading only the record headers."""
+        offset = len(TRACE_MAGIC)
+        end = len(self._map)
+        while offset + _RECORD_HEADER.size <= end:
+            digest, profile_len, prompt_len, output_len, duration = _RECORD_HEADER.unpack_from(self._map, offset)
+            profile_start = offset + _RECORD_HEADER.size
+            prompt_start = profile_start + profile_len
+            output_start = prompt_start + prompt_len
+            output_end = output_start + output_len
+            if output_end > end:
+                # Truncated trailing record from an interrupted recording
+                break
+
+            profile = self._map[profile_start:prompt_start].decode("utf-8")
+            entry = (prompt_start, prompt_len, output_start, output_len, duration)
+            self._index[digest] = entry
+            self._by_profile.setdefault(profile, []).append(entry)
+            offset = output_end
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _lookup(self, prompt: str, profile: Optional[str]) -> tuple:
+        entry = self._index.get(trace_key(prompt, profile))
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        candidates = self._by_profile.get(profile or "", [])
+        if self.fallback != FALLBACK_NEAREST or not candidates:
+            raise TraceMissError(
+                f"Prompt not found in trace {self.trace_path} (profile {profile!r}): {prompt[:80]!r}"
+            )
+
+        self.nearest_matches += 1
+        return self._nearest(prompt, candidates)
+
+    def _nearest(self, prompt: str, candidates: List[tuple]) -> tuple:
+        """Find the recorded prompt most similar to the given one."""
+        matcher = difflib.SequenceMatcher(autojunk=False)
+        matcher.set_seq2(prompt)
+        best_entry, best_ratio = candidates[0], -1.0
+        for entry in candidates:
+            prompt_start, prompt_len = entry[0], entry[1]
+            matcher.set_seq1(self._map[prompt_start:prompt_start + prompt_len].decode("utf-8"))
+            # Cheap upper bounds first, the full ratio only for promising candidates
+            if matcher.real_quick_ratio() <= best_ratio or matcher.quick_ratio() <= best_ratio:
+                continue
+            ratio = matcher.ratio()
+            if ratio > best_ratio:
+                best_entry, best_ratio = entry, ratio
+        return best_entry
+
+    def _wait(self, duration: float, deadline: Optional[Deadline]) -> None:
+        """Sleep for the recorded duration, failing like the real executor on deadline expiry."""
+        delay = duration / self.speed if self.speed > 0 else 0.0
+        if deadline and deadline.remaining() < delay:
+            time.sleep(deadline.remaining())
+            raise DeadlineExceededError("executor", deadline.timeout)
+        if delay > 0:
+            time.sleep(delay)
+
+    def execute(self, prompt: str, deadline: Optional[Deadline] = None,
+                profile: Optional[str] = None) -> str:
+        """Return the recorded output for the prompt."""
+        if deadline:
+            deadline.check("executor")
+        _, _, output_start, output_len, duration = self._lookup(prompt, profile)
+        if self.realtime:
+            self._wait(duration, deadline)
+        return self._map[output_start:output_start + output_len].decode("utf-8")
+
+    def execute_stream(self, prompt: str, deadline: Optional[Deadline] = None,
+                       profile: Optional[str] = None) -> Iterator[str]:
+        """Yield the recorded output in chunks, spread over the recorded duration in realtime mode."""
+        if deadline:
+            deadline.check("executor")
+        _, _, output_start, output_len, duration = self._lookup(prompt, profile)
+        output = self._map[output_start:output_start + output_len].decode("utf-8")
+        chunks = [
+            output[i:i + self.stream_chunk_size]
+            for i in range(0, len(output), self.stream_chunk_size)
+        ]
+        for chunk in chunks:
+            if self.realtime:
+                self._wait(duration / len(chunks), deadline)
+            yield chunk
+
+    def close(self) -> None:
+        """Release the memory map and the trace file."""
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
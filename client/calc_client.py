@@ -7,7 +7,6 @@ import asyncio
 import os
 import sys
 from mcp.client.stdio import stdio_client
-from mcp import ClientSession
 
 # Add the parent directory to sys.path so we can import from cli package
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -21,6 +20,18 @@ class CalculatorClient(MCPClient):
     Implements specific workflows for calculator operations.
     """
     
+    def __init__(self, server_script_path, speculative=False, request_timeout=None):
+        """
+        Initialize the calculator client.
+        
+        Args:
+            server_script_path: Absolute path to the MCP server script
+            speculative: Call tools while the LLM is still decoding its selection
+            request_timeout: Optional time budget in seconds for the LLM-driven request
+        """
+        super().__init__(server_script_path, request_timeout, prefetch_uris=["greeting://hello"])
+        self.speculative = speculative
+    
     async def run(self):
         """
         Run the calculator client workflow.
@@ -28,13 +39,13 @@ class CalculatorClient(MCPClient):
         """
         try:
             async with stdio_client(self.server_params) as (read, write):
-                async with ClientSession(read, write) as session:
+                async with self.create_session(read, write) as session:
                     # ============== SERVER CONNECTION ==============
                     print(f"\n{'='*60}")
                     print("CONNECTING TO MCP SERVER")
                     print(f"{'='*60}")
 
-                    await session.initialize()
+                    await self.initialize_session(session)
                     print("Connected to MCP server successfully!\n")
 
                     # ============== RESOURCES ==============
@@ -69,6 +80,7 @@ class CalculatorClient(MCPClient):
                     content, mime_type = await self.read_resource(session, "greeting://hello")
                     print(f"  Content: {content}")
                     print(f"  MIME Type: {mime_type}")
+                    print(f"  Resource cache: {self.resource_cache}")
 
                     # ============== DIRECT TOOL CALL ==============
                     print(f"\n{'='*60}")
@@ -77,18 +89,45 @@ class CalculatorClient(MCPClient):
                     result = await self.call_tool(session, "add", {"a": 1, "b": 7})
                     print(f"  Result: {result.content}")
 
+                    # ============== STREAMED TOOL CALL ==============
+                    print(f"\n{'='*60}")
+                    print("STREAMED TOOL CALL (fibonacci 2000)")
+                    print(f"{'='*60}")
+                    received = 0
+                    async for event in self.call_tool_stream(session, "fibonacci", {"count": 2000}):
+                        if event["type"] == "progress":
+                            print(f"  Progress: {event['progress']}/{event['total']} {event['message'] or ''}")
+                        elif event["type"] == "chunk":
+                            received += len(event["data"])
+                            print(f"  Chunk {event['index'] + 1}/{event['pages']}: {len(event['data'])} characters")
+                        else:
+                            print(f"  Result: {event['result'].content}")
+                    print(f"  Received {received} characters in total")
+
                     # ============== LLM-DRIVEN TOOL CALLS ==============
                     print(f"\n{'='*60}")
                     print("LLM-DRIVEN TOOL SELECTION")
                     print(f"{'='*60}")
                     prompt = "Add 2 to 20"
                     print(f"  Prompt: '{prompt}'")
-                    functions_to_call = self.choose_mcp_tools(prompt, functions)
-
-                    print(f"\n  Calling suggested tools:")
-                    for f in functions_to_call:
-                        result = await self.call_tool(session, f["name"], f["args"])
-                        print(f"    → {f['name']}({f['args']}) = {result.content}")
+                    deadline = self.new_deadline()
+                    if self.speculative:
+                        results = await self.call_mcp_tools_speculatively(
+                            session, prompt, functions, tools, deadline
+                        )
+
+                        print(f"\n  Suggested tool results:")
+                        for f, result in results:
+                            print(f"    → {f['name']}({f['args']}) = {result.content}")
+                        print(f"\n  Speculation: {self.speculation_stats}")
+                    else:
+                        functions_to_call = self.choose_mcp_tools(prompt, functions, deadline)
+
+                        print(f"\n  Calling suggested tools:")
+                        for f in functions_to_call:
+                            result = await self.call_tool(session, f["name"], f["args"], deadline)
+                            print(f"    → {f['name']}({f['args']}) = {result.content}")
+                    print(f"\n  Argument validation: {self.argument_validator}")
 
                     # ============== COMPLETION ==============
                     print(f"\n{'='*60}")
@@ -109,7 +148,7 @@ async def main():
     server_script = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'server', 'calc_server.py'))
     
     # Initialize the calculator client with the server script
-    client = CalculatorClient(server_script)
+    client = CalculatorClient(server_script, speculative="--speculative" in sys.argv)
     
     # Run the calculator workflow
     await client.run()
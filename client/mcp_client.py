@@ -1,7 +1,13 @@
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.shared.exceptions import McpError
+import mcp.types as types
+import anyio
+import asyncio
+import json
 import os
 import sys
+import time
 
 # Add the parent directory to sys.path so we can import from cli package
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -9,6 +15,12 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 # llm
 from cli.call_llm import LLMClient
 from cli.tool_formatter import MCPToolFormatter
+from cli.deadline import Deadline, DeadlineExceededError
+from cli.argument_validator import ToolArgumentValidator, ArgumentValidationError
+
+from speculation import SpeculationStats
+from resource_cache import ResourceCache
+from sampling_session import ConcurrentSamplingSession
 
 
 class MCPClient:
@@ -17,21 +29,35 @@ class MCPClient:
     
     This is a base client that provides core functionality for:
     - Connecting to MCP servers
-    - Listing and reading resources
+    - Listing and reading resources, with a client-side resource cache
     - Listing available tools
-    - Calling tools on the server
+    - Calling tools on the server, optionally streaming progress and chunked results
     - Using LLM to select tools based on prompts
+    - Validating and repairing LLM tool calls against the tools' input schemas
+    - Speculatively calling side-effect-free tools while the LLM is decoding
+    - Answering server sampling requests with the local LLM
+    - Enforcing per-request deadlines, cancelling MCP requests that run out of time
     
     Subclasses can override methods or the run() method to implement
     specific use case workflows.
     """
     
-    def __init__(self, server_script_path):
+    def __init__(self, server_script_path, request_timeout=None, tool_call_retries=1,
+                 prefetch_uris=None, resource_cache=None, sampling_concurrency=1,
+                 llm_executor=None):
         """
         Initialize the MCP Client.
         
         Args:
             server_script_path: Absolute path to the MCP server script
+            request_timeout: Optional time budget in seconds for each top-level request
+            tool_call_retries: How often to re-prompt the LLM when its tool calls
+                cannot be repaired locally
+            prefetch_uris: Resource URIs to read into the cache right after initialization
+            resource_cache: Optional ResourceCache to use instead of the default one
+            sampling_concurrency: Maximum number of sampling requests answered at once
+            llm_executor: Optional executor for the LLM, e.g. a DaemonExecutor to
+                share one loaded model between client processes
         """
         print(f"\n{'='*60}")
         print(f"MCP Client Configuration")
@@ -44,94 +70,636 @@ class MCPClient:
             env=None,
         )
 
-        self.llm_client = LLMClient()
+        self.llm_client = LLMClient(executor=llm_executor)
         self.tool_formatter = MCPToolFormatter()
+        self.speculation_stats = SpeculationStats()
+        self.request_timeout = request_timeout
+        self.tool_call_retries = tool_call_retries
+        self.argument_validator = ToolArgumentValidator()
+        self.prefetch_uris = list(prefetch_uris or [])
+        self.resource_cache = resource_cache or ResourceCache()
+        self._supports_subscribe = False
+        self._subscribed_uris = set()
+        self._pending_reads = {}
+        self._updated_during_read = set()
+        self.sampling_concurrency = sampling_concurrency
+        self._sampling_slots = None
+
+    def create_session(self, read, write, enable_sampling=False):
+        """
+        Create a client session that routes server notifications to this client.
+        
+        Args:
+            read: The transport read stream
+            write: The transport write stream
+            enable_sampling: Advertise the sampling capability and answer
+                sampling requests concurrently with the local LLM
+            
+        Returns:
+            A ClientSession, to be used as an async context manager
+        """
+        if enable_sampling:
+            return ConcurrentSamplingSession(
+                read,
+                write,
+                sampling_callback=self.handle_sampling_request,
+                message_handler=self.handle_message,
+            )
+        return ClientSession(read, write, message_handler=self.handle_message)
+
+    async def initialize_session(self, session):
+        """
+        Initialize the session and warm the resource cache.
+        
+        Args:
+            session: The MCP session
+            
+        Returns:
+            The server's initialize result
+        """
+        result = await session.initialize()
+
+        # Subscriptions belong to a session, so start from a clean cache
+        self.resource_cache.clear()
+        self._subscribed_uris = set()
+        self._updated_during_read = set()
+        resources = result.capabilities.resources
+        self._supports_subscribe = bool(resources and resources.subscribe)
+
+        if self.prefetch_uris:
+            await self.prefetch_resources(session, self.prefetch_uris)
+        return result
+
+    async def prefetch_resources(self, session, resource_uris, deadline=None):
+        """
+        Warm the resource cache, reporting resources that could not be read.
+        
+        Prefetching is only an optimization, so a failed read is logged and
+        the remaining resources are still fetched.
+        
+        Args:
+            session: The MCP session
+            resource_uris: The URIs of the resources to read
+            deadline: Optional deadline for the requests
+            
+        Returns:
+            Number of resources that were read
+        """
+        outcomes = await asyncio.gather(
+            *(self.read_resource(session, uri, deadline) for uri in resource_uris),
+            return_exceptions=True,
+        )
+        loaded = 0
+        for uri, outcome in zip(resource_uris, outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+            if isinstance(outcome, Exception):
+                print(f"  Could not prefetch {uri}: {outcome}")
+            else:
+                loaded += 1
+        return loaded
+
+    async def handle_message(self, message):
+        """
+        Handle messages from the server that are not responses to our requests.
+        
+        Args:
+            message: A server request responder, notification or exception
+        """
+        if isinstance(message, types.ServerNotification):
+            if isinstance(message.root, types.ResourceUpdatedNotification):
+                uri = str(message.root.params.uri)
+                self.resource_cache.invalidate(uri)
+                if uri in self._pending_reads:
+                    self._updated_during_read.add(uri)
+
+    async def handle_sampling_request(self, context, params):
+        """
+        Answer a sampling request from the server with the local LLM.
+        
+        The blocking LLM call runs in a worker thread so the session keeps
+        processing other messages; at most sampling_concurrency requests are
+        sent to the LLM at once and the rest wait their turn.
+        
+        genie-t2t-run has no per-request limit on generated tokens, so
+        params.maxTokens is applied to the completion afterwards, counting
+        whitespace-separated words as an approximation of tokens.
+        
+        Args:
+            context: The request context
+            params: The CreateMessageRequest parameters
+            
+        Returns:
+            The CreateMessageResult for the server
+        """
+        if self._sampling_slots is None:
+            self._sampling_slots = asyncio.Semaphore(self.sampling_concurrency)
+
+        user_message = "\n".join(
+            message.content.text
+            for message in params.messages
+            if message.content.type == "text"
+        )
+        if params.systemPrompt:
+            user_message = f"{params.systemPrompt}\n\n{user_message}"
+        prompt = self.llm_client.build_prompt(user_message)
+
+        async with self._sampling_slots:
+            response = await asyncio.to_thread(self.llm_client.ask, prompt, self.new_deadline(), "chat")
 
-    def choose_mcp_tools(self, prompt, functions):
+        stop_reason = "endTurn"
+        words = response.split()
+        if params.maxTokens is not None and len(words) > params.maxTokens:
+            response = " ".join(words[:params.maxTokens])
+            stop_reason = "maxTokens"
+
+        return types.CreateMessageResult(
+            role="assistant",
+            content=types.TextContent(type="text", text=response),
+            model="local-llm",
+            stopReason=stop_reason,
+        )
+
+    def new_deadline(self):
+        """
+        Create the deadline for a new top-level request.
+        
+        Returns:
+            A Deadline expiring after request_timeout, or None if no timeout is configured
+        """
+        if self.request_timeout is None:
+            return None
+        return Deadline.after(self.request_timeout)
+
+    def choose_mcp_tools(self, prompt, functions, deadline=None):
         """
         Use LLM to choose which tools to call based on the prompt.
         
         Args:
             prompt: The user's prompt
             functions: Available functions/tools
+            deadline: Optional deadline for the request
             
         Returns:
             List of functions to call with their arguments
         """
-        response = self.llm_client.choose_mcp_tools(prompt, functions)
-        print(f"\nLLM Response: {response}")
+        response, content = self.llm_client.choose_mcp_tools_with_content(prompt, functions, deadline)
+        return self._validate_selection(prompt, functions, response, content, deadline)
+
+    def _validate_selection(self, prompt, functions, response, content, deadline=None):
+        """
+        Validate the LLM's tool selection, re-prompting while it is invalid.
         
-        functions_to_call = []
-        if response:
-            for tool_call in response:
-                # Handle the nested JSON structure: {"tool": "function", "arguments": {"function": "add", "arguments": {...}}}
-                if tool_call.get("tool") == "function":
-                    args_section = tool_call.get("arguments", {})
-                    function_name = args_section.get("function", "")
-                    function_args = args_section.get("arguments", {})
-                    
-                    if function_name:  # Only add if we have a valid tool name
-                        functions_to_call.append({"name": function_name, "args": function_args})
+        Calls that cannot be repaired locally and output that does not parse
+        into tool calls at all are validation failures. Each failure re-prompts
+        the LLM with the errors, up to tool_call_retries times.
         
+        Args:
+            prompt: The user's prompt
+            functions: Available functions/tools
+            response: Tool calls parsed from the first LLM response
+            content: The LLM content the tool calls were parsed from
+            deadline: Optional deadline for the re-prompts
+            
+        Returns:
+            List of functions to call with their arguments
+        """
+        for attempt in range(self.tool_call_retries + 1):
+            print(f"\nLLM Response: {response}")
+            functions_to_call, errors = self._to_function_calls(response)
+            if self._is_unparseable_selection(response, content):
+                errors.append(f"the response was not a JSON list of tool calls: {content[:200]!r}")
+            if not errors or attempt == self.tool_call_retries:
+                break
+
+            # Local repair was not enough, so ask again with the validation errors
+            print(f"  Re-prompting after invalid tool calls: {errors}")
+            request = (
+                f"{prompt}\n\nYour previous tool calls were invalid: {'; '.join(errors)}. "
+                "Respond again using the exact tool and parameter names and types, "
+                "or with [] if no tool is needed."
+            )
+            response, content = self.llm_client.choose_mcp_tools_with_content(request, functions, deadline)
+
         return functions_to_call
 
-    async def list_resources(self, session):
+    def _is_unparseable_selection(self, response, content):
+        """
+        Check whether the LLM produced output that did not parse into any tool call.
+        
+        An explicit empty list means the LLM chose no tools and is not an error.
+        
+        Args:
+            response: Tool calls parsed from the LLM response
+            content: The LLM content the tool calls were parsed from
+            
+        Returns:
+            True if the content is non-empty but yielded no tool calls
+        """
+        if response or not content.strip():
+            return False
+
+        cleaned = content.strip().strip("`").strip()
+        if cleaned.startswith("json"):
+            cleaned = cleaned[4:]
+        try:
+            return json.loads(cleaned) not in ([], {})
+        except json.JSONDecodeError:
+            return True
+
+    def _to_function_calls(self, response):
+        """
+        Convert parsed LLM tool calls into validated functions to call.
+        
+        Cheap local repairs (type coercion, near-miss parameter names, nested
+        call shapes) are applied by the argument validator.
+        
+        Args:
+            response: Tool calls parsed from the LLM response
+            
+        Returns:
+            Tuple of (functions to call with their arguments, validation error messages)
+        """
+        functions_to_call = []
+        errors = []
+        for tool_call in response or []:
+            try:
+                functions_to_call.append(self.argument_validator.validate_call(tool_call))
+            except ArgumentValidationError as e:
+                print(f"  Rejected tool call {tool_call}: {e}")
+                errors.append(str(e))
+        
+        return functions_to_call, errors
+
+    def side_effect_free_tools(self, tools):
+        """
+        Get the names of tools that are safe to call speculatively.
+        
+        Args:
+            tools: The tools listed by the server
+            
+        Returns:
+            Set of tool names the server marks as read-only
+        """
+        return {
+            tool.name
+            for tool in tools.tools
+            if tool.annotations is not None and tool.annotations.readOnlyHint
+        }
+
+    async def call_mcp_tools_speculatively(self, session, prompt, functions, tools, deadline=None):
+        """
+        Use LLM to choose tools and call them, overlapping calls with decoding.
+        
+        Side-effect-free tools are dispatched as soon as their arguments are
+        complete in the partially decoded output. The final selection is
+        validated and re-prompted like in choose_mcp_tools, and a speculative
+        result is only committed if the validated selection contains the same
+        call; otherwise it is discarded. Hits, misses and latency saved are recorded in speculation_stats.
+        
+        Args:
+            session: The MCP session
+            prompt: The user's prompt
+            functions: Available functions/tools
+            tools: The tools listed by the server
+            deadline: Optional deadline covering decoding and all tool calls
+            
+        Returns:
+            List of (function, result) tuples for the functions chosen by the LLM
+        """
+        loop = asyncio.get_running_loop()
+        side_effect_free = self.side_effect_free_tools(tools)
+        speculative_calls = []
+
+        async def timed_call(name, args, request_ids):
+            result = await self.call_tool(session, name, args, deadline, request_ids)
+            return result, time.perf_counter()
+
+        def dispatch(tool_call):
+            try:
+                tool_call = self.argument_validator.validate_call(
+                    {"tool": tool_call["name"], "arguments": tool_call["args"]}, record=False
+                )
+            except ArgumentValidationError:
+                return
+            if tool_call["name"] not in side_effect_free:
+                return
+            print(f"  Speculatively calling {tool_call['name']}({tool_call['args']})")
+            self.speculation_stats.record_dispatch()
+            request_ids = []
+            speculative_calls.append({
+                "function": tool_call,
+                "task": asyncio.ensure_future(timed_call(tool_call["name"], tool_call["args"], request_ids)),
+                "request_ids": request_ids,
+                "dispatched_at": time.perf_counter(),
+                "committed": False,
+            })
+
+        def on_tool_call(tool_call):
+            # Called from the decoding thread
+            loop.call_soon_threadsafe(dispatch, tool_call)
+
+        results = []
+        try:
+            response, content = await asyncio.to_thread(
+                self.llm_client.choose_mcp_tools_streaming_with_content, prompt, functions, on_tool_call, deadline
+            )
+            decoded_at = time.perf_counter()
+
+            # Same validation and re-prompting as choose_mcp_tools; re-prompts are not streamed
+            functions_to_call = await asyncio.to_thread(
+                self._validate_selection, prompt, functions, response, content, deadline
+            )
+            for function in functions_to_call:
+                speculative = next(
+                    (s for s in speculative_calls if not s["committed"] and s["function"] == function),
+                    None,
+                )
+                if speculative is None:
+                    result = await self.call_tool(session, function["name"], function["args"], deadline)
+                else:
+                    speculative["committed"] = True
+                    result, completed_at = await speculative["task"]
+                    self.speculation_stats.record_hit(speculative["dispatched_at"], completed_at, decoded_at)
+                results.append((function, result))
+
+        finally:
+            # Discard speculative calls that the final parse did not confirm
+            for speculative in speculative_calls:
+                if not speculative["committed"]:
+                    if speculative["task"].done():
+                        # Retrieve the outcome so a failed discarded call is not reported
+                        if not speculative["task"].cancelled():
+                            speculative["task"].exception()
+                    else:
+                        speculative["task"].cancel()
+                        # Tell the server to stop working on a call that was already sent
+                        if speculative["request_ids"]:
+                            await self._cancel_request(
+                                session, speculative["request_ids"][0], "Speculative call discarded"
+                            )
+                    self.speculation_stats.record_miss()
+
+        return results
+
+    async def _request_with_deadline(self, session, stage, request, deadline, request_ids=None):
+        """
+        Await an MCP request, cancelling it if the deadline expires first.
+        
+        On expiry the server is told to stop working on the request with a
+        notifications/cancelled message.
+        
+        Args:
+            session: The MCP session
+            stage: Name of the request, reported in DeadlineExceededError
+            request: Callable returning the request coroutine
+            deadline: Optional deadline for the request
+            request_ids: Optional list the request's JSON-RPC id is appended to,
+                for callers that cancel the request themselves
+            
+        Returns:
+            The result of the request
+            
+        Raises:
+            DeadlineExceededError: If the deadline expires before the response arrives
+        """
+        if deadline is None and request_ids is None:
+            return await request()
+
+        if deadline is not None:
+            deadline.check(stage)
+
+        # No await may happen between reading the id and sending the request
+        request_id = self._next_request_id(session)
+        if request_ids is not None:
+            request_ids.append(request_id)
+
+        if deadline is None:
+            return await request()
+
+        with anyio.move_on_after(deadline.remaining()):
+            return await request()
+
+        await self._cancel_request(session, request_id, f"Deadline exceeded during {stage}")
+        raise DeadlineExceededError(stage, deadline.timeout)
+
+    def _next_request_id(self, session):
+        """
+        Get the JSON-RPC id the session will assign to the next request it sends.
+        
+        The SDK does not expose the id of an in-flight request, so this reads
+        the private BaseSession._request_id counter (mcp 1.x, checked against
+        1.12). It assumes send_request takes the counter's value before its
+        first await and that the ClientSession method reaches send_request
+        without awaiting anything else first. The id is only correct if the
+        request coroutine is awaited right after this call, with no other
+        request sent in between.
+        
+        Args:
+            session: The MCP session
+            
+        Returns:
+            The id of the next request
+        """
+        return session._request_id
+
+    async def _cancel_request(self, session, request_id, reason):
+        """
+        Tell the server to stop processing an in-flight request.
+        
+        Args:
+            session: The MCP session
+            request_id: The JSON-RPC id of the request to cancel
+            reason: Human-readable cancellation reason
+        """
+        await session.send_notification(
+            types.ClientNotification(
+                types.CancelledNotification(
+                    method="notifications/cancelled",
+                    params=types.CancelledNotificationParams(requestId=request_id, reason=reason),
+                )
+            )
+        )
+
+    async def list_resources(self, session, deadline=None):
         """
         List all available resources from the server.
         
         Args:
             session: The MCP session
+            deadline: Optional deadline for the request
             
         Returns:
             List of resources
         """
-        resources = await session.list_resources()
+        resources = await self._request_with_deadline(
+            session, "mcp:resources/list", session.list_resources, deadline
+        )
         return resources
 
-    async def list_resource_templates(self, session):
+    async def list_resource_templates(self, session, deadline=None):
         """
         List all available resource templates from the server.
         
         Args:
             session: The MCP session
+            deadline: Optional deadline for the request
             
         Returns:
             List of resource templates
         """
-        resource_templates = await session.list_resource_templates()
+        resource_templates = await self._request_with_deadline(
+            session, "mcp:resources/templates/list", session.list_resource_templates, deadline
+        )
         return resource_templates
 
-    async def list_tools(self, session):
+    async def list_tools(self, session, deadline=None):
         """
         List all available tools from the server.
         
         Args:
             session: The MCP session
+            deadline: Optional deadline for the request
             
         Returns:
             List of function definitions converted to LLM tools
         """
-        tools = await session.list_tools()
+        tools = await self._request_with_deadline(
+            session, "mcp:tools/list", session.list_tools, deadline
+        )
+        self.argument_validator.load_catalog(tools.tools)
         functions = []
         for tool in tools.tools:
             functions.append(self.tool_formatter.convert_to_llm_tool(tool))
         return functions, tools
 
-    async def read_resource(self, session, resource_uri):
+    async def read_resource(self, session, resource_uri, deadline=None):
         """
-        Read a resource from the server.
+        Read a resource, serving it from the resource cache when possible.
+        
+        Concurrent reads of the same uncached URI share a single server
+        request, which runs under the deadline of the reader that started it.
+        Every reader still waits no longer than its own deadline, and a reader
+        whose deadline has not expired fetches again if the shared request ran
+        out of time.
         
         Args:
             session: The MCP session
             resource_uri: The URI of the resource to read
+            deadline: Optional deadline for the request
+            
+        Returns:
+            Tuple of (content, mime_type), where content is the text of the
+            resource contents (base64 for binary contents) joined together and
+            mime_type is the MIME type of the first content
+            
+        Raises:
+            DeadlineExceededError: If the deadline expires before the resource is read
+        """
+        uri = str(resource_uri)
+        result = self.resource_cache.get(uri)
+        while result is None:
+            pending = self._pending_reads.get(uri)
+            started = pending is None
+            if started:
+                pending = asyncio.ensure_future(self._fetch_resource(session, uri, deadline))
+                self._pending_reads[uri] = pending
+                pending.add_done_callback(lambda done: self._forget_pending_read(uri, done))
+            try:
+                if deadline is None:
+                    result = await asyncio.shield(pending)
+                else:
+                    deadline.check("mcp:resources/read")
+                    result = await asyncio.wait_for(asyncio.shield(pending), deadline.remaining())
+            except DeadlineExceededError:
+                if started:
+                    raise
+                # The reader that started the request ran out of time, not this one
+                self._forget_pending_read(uri, pending)
+            except asyncio.TimeoutError:
+                raise DeadlineExceededError("mcp:resources/read", deadline.timeout)
+
+        return self._resource_content(result)
+
+    def _forget_pending_read(self, uri, task):
+        """Stop sharing a finished read, unless a newer read already replaced it."""
+        if self._pending_reads.get(uri) is task:
+            del self._pending_reads[uri]
+
+    def _resource_content(self, result):
+        """
+        Convert a read result into (content, mime_type).
+        
+        Args:
+            result: The ReadResourceResult returned by the server
             
         Returns:
             Tuple of (content, mime_type)
         """
-        content, mime_type = await session.read_resource(resource_uri)
-        return content, mime_type
+        parts = []
+        mime_type = None
+        for content in result.contents:
+            if mime_type is None:
+                mime_type = content.mimeType
+            text = getattr(content, "text", None)
+            parts.append(text if text is not None else getattr(content, "blob", ""))
+        return "".join(parts), mime_type
+
+    async def read_resources(self, session, resource_uris, deadline=None):
+        """
+        Read several resources, fetching cache misses concurrently.
+        
+        Args:
+            session: The MCP session
+            resource_uris: The URIs of the resources to read
+            deadline: Optional deadline for the requests
+            
+        Returns:
+            List of (content, mime_type) tuples in the order of resource_uris
+        """
+        return await asyncio.gather(
+            *(self.read_resource(session, uri, deadline) for uri in resource_uris)
+        )
+
+    async def _fetch_resource(self, session, uri, deadline):
+        """
+        Read a resource from the server and cache it.
+        
+        Resources are subscribed to before they are read when the server
+        supports it, so they stay cached until the server reports an update.
+        If an update arrives while the read is in flight, the result may
+        already be outdated and is cached with the TTL instead. Resources
+        without a subscription expire after the cache TTL.
+        
+        Args:
+            session: The MCP session
+            uri: The URI of the resource to read
+            deadline: Optional deadline for the request
+            
+        Returns:
+            The server's read result
+        """
+        self._updated_during_read.discard(uri)
 
-    async def call_tool(self, session, tool_name, arguments):
+        if self._supports_subscribe and uri not in self._subscribed_uris:
+            try:
+                await self._request_with_deadline(
+                    session, "mcp:resources/subscribe", lambda: session.subscribe_resource(uri), deadline
+                )
+                self._subscribed_uris.add(uri)
+            except McpError as e:
+                print(f"  Could not subscribe to {uri}, falling back to TTL: {e}")
+
+        result = await self._request_with_deadline(
+            session, "mcp:resources/read", lambda: session.read_resource(uri), deadline
+        )
+
+        subscribed = uri in self._subscribed_uris and uri not in self._updated_during_read
+        self._updated_during_read.discard(uri)
+        self.resource_cache.put(uri, result, subscribed=subscribed)
+        return result
+
+    async def call_tool(self, session, tool_name, arguments, deadline=None, request_ids=None):
         """
         Call a tool on the server.
         
@@ -139,13 +707,113 @@ class MCPClient:
             session: The MCP session
             tool_name: Name of the tool to call
             arguments: Arguments to pass to the tool
+            deadline: Optional deadline for the request
+            request_ids: Optional list the request's JSON-RPC id is appended to,
+                for callers that cancel the call themselves
             
         Returns:
             The result of the tool call
         """
-        result = await session.call_tool(tool_name, arguments=arguments)
+        result = await self._request_with_deadline(
+            session, f"mcp:tools/call:{tool_name}",
+            lambda: session.call_tool(tool_name, arguments=arguments), deadline, request_ids
+        )
         return result
 
+    async def call_tool_stream(self, session, tool_name, arguments, deadline=None):
+        """
+        Call a tool and yield its progress and result as they arrive.
+        
+        Progress notifications are yielded while the tool runs. If the tool
+        returns a chunked result manifest, its pages are read and yielded one
+        at a time instead of the manifest. Closing the generator early
+        cancels the tool call on the server.
+        
+        Args:
+            session: The MCP session
+            tool_name: Name of the tool to call
+            arguments: Arguments to pass to the tool
+            deadline: Optional deadline for the call and the page reads
+            
+        Yields:
+            Dicts with a "type" of "progress" (progress, total, message),
+            "chunk" (index, pages, data) or "result" (result)
+        """
+        events = asyncio.Queue()
+        request_ids = []
+
+        async def on_progress(progress, total, message):
+            events.put_nowait({"type": "progress", "progress": progress, "total": total, "message": message})
+
+        call = asyncio.ensure_future(self._request_with_deadline(
+            session, f"mcp:tools/call:{tool_name}",
+            lambda: session.call_tool(tool_name, arguments=arguments, progress_callback=on_progress),
+            deadline, request_ids
+        ))
+        try:
+            while not call.done():
+                next_event = asyncio.ensure_future(events.get())
+                await asyncio.wait({next_event, call}, return_when=asyncio.FIRST_COMPLETED)
+                if next_event.done():
+                    yield next_event.result()
+                else:
+                    next_event.cancel()
+
+            while not events.empty():
+                yield events.get_nowait()
+
+            result = call.result()
+            manifest = self._chunked_result_manifest(result)
+            if manifest is None:
+                yield {"type": "result", "result": result}
+                return
+
+            # Pages are streamed straight through and bypass the resource cache
+            for index in range(manifest["pages"]):
+                uri = f"{manifest['uri_prefix']}{index}"
+                page = await self._request_with_deadline(
+                    session, "mcp:resources/read", lambda: session.read_resource(uri), deadline
+                )
+                data = "".join(getattr(content, "text", "") for content in page.contents)
+                yield {"type": "chunk", "index": index, "pages": manifest["pages"], "data": data}
+
+        finally:
+            if not call.done():
+                call.cancel()
+                if request_ids:
+                    await self._cancel_request(session, request_ids[0], "Stream closed by client")
+
+    def _chunked_result_manifest(self, result):
+        """
+        Extract the chunked result manifest from a tool result, if it has one.
+        
+        Args:
+            result: The result of the tool call
+            
+        Returns:
+            The manifest dict, or None for regular results
+        """
+        if result.isError:
+            return None
+
+        payload = result.structuredContent
+        if payload is None:
+            for content in result.content:
+                if content.type != "text":
+                    continue
+                try:
+                    payload = json.loads(content.text)
+                except json.JSONDecodeError:
+                    return None
+                break
+
+        if not isinstance(payload, dict):
+            return None
+        manifest = payload.get("chunked_result")
+        if isinstance(manifest, dict) and "uri_prefix" in manifest and "pages" in manifest:
+            return manifest
+        return None
+
     async def run(self):
         """
         Main entry point for the MCP client.
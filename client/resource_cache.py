@@ -0,0 +1,138 @@
+"""
+Client-side cache for MCP resource contents.
+"""
+import time
+from collections import OrderedDict
+
+
+class ResourceCache:
+    """
+    Caches resource read results by URI.
+
+    The cache is bounded by the total size of the cached contents and evicts
+    the least recently used entries first. Entries for subscribed resources
+    stay valid until the server reports an update; all other entries expire
+    after a TTL.
+    """
+
+    def __init__(self, max_bytes=1024 * 1024, ttl=30.0):
+        """
+        Initialize the resource cache.
+
+        Args:
+            max_bytes: Upper bound for the total size of cached contents
+            ttl: Seconds an unsubscribed entry stays valid
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def result_size(result):
+        """
+        Estimate the size of a read_resource result in bytes.
+
+        Args:
+            result: The ReadResourceResult returned by the server
+
+        Returns:
+            Size of the text and blob contents in bytes
+        """
+        size = 0
+        for content in getattr(result, "contents", []):
+            text = getattr(content, "text", None)
+            blob = getattr(content, "blob", None)
+            if text is not None:
+                size += len(text.encode("utf-8"))
+            if blob is not None:
+                size += len(blob)
+        return size
+
+    def get(self, uri):
+        """
+        Look up a cached result.
+
+        Args:
+            uri: The resource URI
+
+        Returns:
+            The cached result, or None if it is missing or expired
+        """
+        entry = self._entries.get(uri)
+        if entry is not None and entry["expires_at"] is not None and time.monotonic() >= entry["expires_at"]:
+            self._remove(uri)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(uri)
+        self.hits += 1
+        return entry["result"]
+
+    def put(self, uri, result, subscribed=False):
+        """
+        Store a result, evicting least recently used entries to stay within budget.
+
+        Args:
+            uri: The resource URI
+            result: The ReadResourceResult returned by the server
+            subscribed: Whether the server will notify us when the resource changes
+        """
+        size = self.result_size(result)
+        self._remove(uri)
+        if size > self.max_bytes:
+            return
+
+        while self.total_bytes + size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.total_bytes -= evicted["size"]
+            self.evictions += 1
+
+        self._entries[uri] = {
+            "result": result,
+            "size": size,
+            "expires_at": None if subscribed else time.monotonic() + self.ttl,
+        }
+        self.total_bytes += size
+
+    def invalidate(self, uri):
+        """
+        Drop a resource after the server reported that it changed.
+
+        Args:
+            uri: The resource URI
+        """
+        if self._remove(uri):
+            self.invalidations += 1
+
+    def clear(self):
+        """Drop all cached entries."""
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def _remove(self, uri):
+        entry = self._entries.pop(uri, None)
+        if entry is None:
+            return False
+        self.total_bytes -= entry["size"]
+        return True
+
+    def __contains__(self, uri):
+        return uri in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __str__(self):
+        return (
+            f"entries={len(self._entries)}, bytes={self.total_bytes}/{self.max_bytes}, "
+            f"hits={self.hits}, misses={self.misses}, evictions={self.evictions}, "
+            f"invalidations={self.invalidations}"
+        )
@@ -7,7 +7,6 @@ import asyncio
 import os
 import sys
 from mcp.client.stdio import stdio_client
-from mcp import ClientSession
 
 # Add the parent directory to sys.path so we can import from cli package
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -28,14 +27,14 @@ class SamplingClient(MCPClient):
         """
         try:
             async with stdio_client(self.server_params) as (read, write):
-                async with ClientSession(read, write) as session:
+                async with self.create_session(read, write, enable_sampling=True) as session:
                     # ============== SERVER CONNECTION ==============
                     print(f"\n{'='*60}")
                     print("CONNECTING TO MCP SERVER")
                     print(f"{'='*60}")
 
                     # Initialize with sampling capability enabled
-                    await self.initialize_session(session, enable_sampling=True)
+                    await self.initialize_session(session)
                     print("Connected to MCP server successfully!\n")
 
                     # ============== DIRECT TOOL CALL (useSampling) ==============
@@ -45,6 +44,13 @@ class SamplingClient(MCPClient):
                     result = await self.call_tool(session, "useSampling", {})
                     print(f"  Result: {result.content}")
 
+                    # ============== PARALLEL SAMPLING (useSamplingFanOut) ==============
+                    print(f"\n{'='*60}")
+                    print("PARALLEL SAMPLING (useSamplingFanOut)")
+                    print(f"{'='*60}")
+                    result = await self.call_tool(session, "useSamplingFanOut", {})
+                    print(f"  Result: {result.content}")
+
         except Exception as e:
             import traceback
 
@@ -0,0 +1,46 @@
+"""
+Client session that answers sampling requests concurrently.
+"""
+from mcp import ClientSession
+from mcp.client.session import ClientResponse
+from mcp.shared.context import RequestContext
+import mcp.types as types
+
+
+class ConcurrentSamplingSession(ClientSession):
+    """
+    ClientSession that handles each sampling request in its own task.
+
+    ClientSession awaits the sampling callback inside its receive loop, so one
+    slow completion holds up every other message from the server, including
+    the remaining requests of a sampling fan-out. This session hands sampling
+    requests to the session's task group instead; the sampling callback
+    decides how many completions actually run at once.
+
+    This overrides the private ClientSession._received_request hook and uses
+    the private _task_group and _sampling_callback attributes as they exist
+    in mcp 1.x (written against 1.12). Check it again when upgrading the SDK.
+    """
+
+    async def _received_request(self, responder):
+        if isinstance(responder.request.root, types.CreateMessageRequest):
+            self._task_group.start_soon(self._respond_to_sampling, responder)
+            return
+        await super()._received_request(responder)
+
+    async def _respond_to_sampling(self, responder):
+        """Run the sampling callback for one request and send its response."""
+        ctx = RequestContext(
+            request_id=responder.request_id,
+            meta=responder.request_meta,
+            session=self,
+            lifespan_context=None,
+        )
+
+        with responder:
+            try:
+                response = await self._sampling_callback(ctx, responder.request.root.params)
+                response = ClientResponse.validate_python(response)
+            except Exception as e:
+                response = types.ErrorData(code=types.INTERNAL_ERROR, message=str(e))
+            await responder.respond(response)
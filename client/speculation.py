@@ -0,0 +1,50 @@
+"""
+Bookkeeping for speculative tool execution.
+"""
+
+
+class SpeculationStats:
+    """
+    Tracks how well speculative tool calls pay off.
+    
+    A speculative call is a hit when the final parse of the LLM output contains
+    the same tool call, otherwise it is discarded as a miss.
+    """
+    
+    def __init__(self):
+        self.dispatched = 0
+        self.hits = 0
+        self.misses = 0
+        self.latency_saved = 0.0
+    
+    def record_dispatch(self):
+        """Record a tool call dispatched before decoding finished."""
+        self.dispatched += 1
+    
+    def record_hit(self, dispatched_at, completed_at, decoded_at):
+        """
+        Record a committed speculative call.
+        
+        Without speculation the call would have started at decoded_at, so the
+        time saved is the part of the call that overlapped with decoding.
+        """
+        self.hits += 1
+        duration = completed_at - dispatched_at
+        self.latency_saved += max(0.0, min(duration, decoded_at - dispatched_at))
+    
+    def record_miss(self):
+        """Record a speculative call whose result was discarded."""
+        self.misses += 1
+    
+    @property
+    def hit_rate(self):
+        """Fraction of dispatched speculative calls that were committed."""
+        if not self.dispatched:
+            return 0.0
+        return self.hits / self.dispatched
+    
+    def __str__(self):
+        return (
+            f"dispatched={self.dispatched}, hits={self.hits}, misses={self.misses}, "
+            f"hit_rate={self.hit_rate:.0%}, latency_saved={self.latency_saved * 1000:.1f}ms"
+        )
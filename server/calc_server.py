@@ -1,35 +1,65 @@
 from mcp.server.session import ServerSession
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.types import ToolAnnotations
+
+from streaming import ChunkStore, ProgressReporter
 
 #Create an MCP Server
 mcp = FastMCP("Calculator Demo")
 
+# The calculator tools are pure, so clients may call them speculatively
+PURE_TOOL = ToolAnnotations(readOnlyHint=True, idempotentHint=True)
+
+# Large results are served page by page as chunks://{result_id}/{page}
+chunk_store = ChunkStore()
+chunk_store.register(mcp)
+
 # Add an addition tool
-@mcp.tool()
+@mcp.tool(annotations=PURE_TOOL)
 def add(a: int, b: int) -> int:
     """ Add two numbers """
     return a + b
 
 # Add a subtraction tool
-@mcp.tool()
+@mcp.tool(annotations=PURE_TOOL)
 def subtract(a: int, b: int) -> int:
     """ Subtract two numbers """
     return a - b
 
 # Add a multiplication tool
-@mcp.tool()
+@mcp.tool(annotations=PURE_TOOL)
 def multiply(a: int, b: int) -> int:
     """ Multiply two numbers """
     return a * b
 
 # Add a division tool
-@mcp.tool()
+@mcp.tool(annotations=PURE_TOOL)
 def divide(a: int, b: int) -> float:
     """ Divide two numbers """
     if b == 0:
         return float("inf")  # Handle division by zero
     return a / b
 
+# Add a long-running tool that reports progress and returns a chunked result
+@mcp.tool()
+async def fibonacci(count: int, ctx: Context[ServerSession, None]) -> dict:
+    """ List the first count Fibonacci numbers """
+    count = max(0, min(count, 10000))
+    # Report every 5 percent; the loop is too fast for a time-based rate limit
+    progress = ProgressReporter(ctx, total=count, min_interval=0)
+    step = max(1, count // 20)
+
+    numbers = []
+    a, b = 0, 1
+    for i in range(count):
+        numbers.append(str(a))
+        a, b = b, a + b
+        if (i + 1) % step == 0:
+            await progress.update(i + 1, f"Computed {i + 1} of {count} numbers")
+    await progress.done("Done")
+
+    return chunk_store.store("\n".join(numbers))
+
 # Add a dynamic greeting resource
 @mcp.resource("greeting://{name}")
 def get_greeting(name: str) -> str:
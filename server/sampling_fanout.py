@@ -0,0 +1,151 @@
+"""
+Sampling fan-out helper for FastMCP server tools.
+Issues several sampling requests to the client concurrently and aggregates
+the completions by concatenation, majority vote or a final reduce prompt.
+"""
+import asyncio
+from collections import Counter
+
+from mcp.types import SamplingMessage, TextContent
+
+
+AGGREGATE_CONCAT = "concat"
+AGGREGATE_VOTE = "vote"
+AGGREGATE_REDUCE = "reduce"
+
+
+class SamplingFanOutResult:
+    """
+    Outcome of a sampling fan-out.
+
+    Attributes:
+        completions: Completion text per prompt, None where the request failed
+        errors: Dict mapping prompt index to the exception that request raised
+        aggregate: The aggregated text
+    """
+
+    def __init__(self, completions, errors, aggregate):
+        self.completions = completions
+        self.errors = errors
+        self.aggregate = aggregate
+
+    @property
+    def succeeded(self):
+        """Number of sampling requests that returned a completion."""
+        return sum(1 for completion in self.completions if completion is not None)
+
+    @property
+    def complete(self):
+        """Whether every sampling request succeeded."""
+        return not self.errors
+
+
+async def sample_text(ctx, prompt, max_tokens=100):
+    """
+    Ask the client to sample a single completion.
+
+    Args:
+        ctx: The FastMCP tool context
+        prompt: The user prompt to send
+        max_tokens: Maximum number of tokens to sample
+
+    Returns:
+        The completion text
+    """
+    result = await ctx.session.create_message(
+        messages=[
+            SamplingMessage(
+                role="user",
+                content=TextContent(type="text", text=prompt),
+            )
+        ],
+        max_tokens=max_tokens,
+    )
+
+    if result.content.type == "text":
+        return result.content.text
+    return str(result.content)
+
+
+def _vote(completions):
+    """Pick the completion most requests agreed on, ignoring case and whitespace."""
+    counts = Counter(" ".join(completion.lower().split()) for completion in completions)
+    winner, _ = counts.most_common(1)[0]
+    return next(c for c in completions if " ".join(c.lower().split()) == winner)
+
+
+async def fan_out_sampling(ctx, prompts, max_tokens=100, max_concurrency=4,
+                           aggregate=AGGREGATE_CONCAT, reduce_prompt=None,
+                           reduce_max_tokens=None, min_successes=1, separator="\n\n"):
+    """
+    Issue several sampling requests concurrently and aggregate the results.
+
+    Failed requests do not fail the fan-out as long as at least min_successes
+    requests return a completion; the aggregate is built from the completions
+    that did arrive and the failures are reported in the result.
+
+    Args:
+        ctx: The FastMCP tool context
+        prompts: The prompts to sample, one request each
+        max_tokens: Maximum number of tokens per sampling request
+        max_concurrency: Maximum number of sampling requests in flight
+        aggregate: "concat", "vote" or "reduce"
+        reduce_prompt: Prompt for the reduce step, with a {completions} placeholder
+        reduce_max_tokens: Maximum number of tokens for the reduce step,
+            defaults to max_tokens
+        min_successes: Minimum number of completions needed to aggregate
+        separator: Text placed between completions when concatenating
+
+    Returns:
+        SamplingFanOutResult with the completions, errors and aggregate
+
+    Raises:
+        ValueError: If the aggregation mode or reduce prompt is invalid
+        RuntimeError: If fewer than min_successes requests succeed
+    """
+    if aggregate not in (AGGREGATE_CONCAT, AGGREGATE_VOTE, AGGREGATE_REDUCE):
+        raise ValueError(f"Unknown aggregation mode: {aggregate}")
+    if aggregate == AGGREGATE_REDUCE and not reduce_prompt:
+        raise ValueError("The reduce aggregation needs a reduce_prompt")
+
+    slots = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def sample(prompt):
+        async with slots:
+            return await sample_text(ctx, prompt, max_tokens)
+
+    outcomes = await asyncio.gather(*(sample(prompt) for prompt in prompts), return_exceptions=True)
+
+    completions = []
+    errors = {}
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, BaseException):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+            errors[index] = outcome
+            completions.append(None)
+        else:
+            completions.append(outcome)
+
+    succeeded = [completion for completion in completions if completion is not None]
+    if len(succeeded) < min_successes:
+        raise RuntimeError(
+            f"Only {len(succeeded)} of {len(prompts)} sampling requests succeeded: "
+            + "; ".join(f"#{index}: {error}" for index, error in errors.items())
+        )
+
+    if not succeeded:
+        result = ""
+    elif aggregate == AGGREGATE_VOTE:
+        result = _vote(succeeded)
+    elif aggregate == AGGREGATE_REDUCE:
+        result = await sample_text(
+            ctx,
+            # replace() rather than format() so literal braces in the prompt are kept
+            reduce_prompt.replace("{completions}", separator.join(succeeded)),
+            reduce_max_tokens or max_tokens,
+        )
+    else:
+        result = separator.join(succeeded)
+
+    return SamplingFanOutResult(completions, errors, result)
@@ -1,6 +1,7 @@
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.session import ServerSession
-from mcp.types import SamplingMessage, TextContent
+
+from sampling_fanout import AGGREGATE_REDUCE, fan_out_sampling, sample_text
 
 #Create an MCP Server
 mcp = FastMCP("Sampling Demo")
@@ -12,22 +13,34 @@ async def useSampling(ctx: Context[ServerSession, None]) -> str:
     
     prompt = f"Describe three use cases where MCP Sampling can be applied on an embedded device."
 
-    result = await ctx.session.create_message(
-        messages=[
-            SamplingMessage(
-                role="user",
-                content=TextContent(type="text", text=prompt),
-            )
-        ],
+    return await sample_text(ctx, prompt, max_tokens=100)
+
+
+# Add a tool that map-reduces several sampling requests issued in parallel
+@mcp.tool()
+async def useSamplingFanOut(ctx: Context[ServerSession, None]) -> str:
+
+    devices = ["a smart thermostat", "an industrial sensor", "a wearable fitness tracker"]
+    prompts = [
+        f"Describe one use case where MCP Sampling can be applied on {device}."
+        for device in devices
+    ]
+
+    result = await fan_out_sampling(
+        ctx,
+        prompts,
         max_tokens=100,
+        max_concurrency=len(prompts),
+        aggregate=AGGREGATE_REDUCE,
+        reduce_prompt="Summarize these MCP Sampling use cases in three short bullet points:\n\n{completions}",
+        reduce_max_tokens=150,
     )
 
-    if result.content.type == "text":
-        return result.content.text
-    return str(result.content)
+    if not result.complete:
+        await ctx.warning(f"{len(result.errors)} of {len(prompts)} sampling requests failed")
+    return result.aggregate
 
 if __name__ == "__main__":
     # Run the server
     print("MCP Server is running on port 5000")
     mcp.run()
-    
@@ -0,0 +1,156 @@
+"""
+Progress and chunked result helpers for long-running FastMCP server tools.
+Progress is reported with MCP progress notifications; large results are
+stored server-side and served as paginated resources instead of being
+returned in a single tool response.
+"""
+import time
+import uuid
+from collections import OrderedDict
+
+import anyio
+
+
+class ProgressReporter:
+    """
+    Reports progress for the current tool call.
+
+    Updates are rate limited so tight loops do not flood the client with
+    notifications. Nothing is sent if the client did not ask for progress.
+    """
+
+    def __init__(self, ctx, total=None, min_interval=0.1):
+        """
+        Initialize the progress reporter.
+
+        Args:
+            ctx: The FastMCP tool context
+            total: Optional total amount of work
+            min_interval: Minimum number of seconds between two notifications
+        """
+        self.ctx = ctx
+        self.total = total
+        self.min_interval = min_interval
+        self._last_sent = None
+
+    async def update(self, progress, message=None, force=False):
+        """
+        Report the current progress.
+
+        Args:
+            progress: Work done so far, increasing with every update
+            message: Optional human-readable status
+            force: Send even if the previous notification was sent very recently
+        """
+        now = time.monotonic()
+        if not force and self._last_sent is not None and now - self._last_sent < self.min_interval:
+            return
+        self._last_sent = now
+        await self.ctx.report_progress(progress, self.total, message)
+        # Let the event loop send the notification even if the caller is CPU-bound
+        await anyio.sleep(0)
+
+    async def done(self, message=None):
+        """Report that all work is complete."""
+        await self.update(self.total if self.total is not None else 1, message, force=True)
+
+
+class ChunkStore:
+    """
+    Holds large tool results so clients can read them page by page.
+
+    Register the store on a FastMCP server to expose the pages as the
+    resource template <scheme>://{result_id}/{page}. A result is released
+    once every page has been read, or after the TTL if the client never
+    reads it all. At most max_results results are kept.
+    """
+
+    def __init__(self, scheme="chunks", chunk_size=64 * 1024, max_results=16, ttl=300.0):
+        """
+        Initialize the chunk store.
+
+        Args:
+            scheme: URI scheme of the page resources
+            chunk_size: Default number of characters per page
+            max_results: Number of results kept before the oldest is dropped
+            ttl: Seconds an incompletely read result is kept
+        """
+        self.scheme = scheme
+        self.chunk_size = chunk_size
+        self.max_results = max_results
+        self.ttl = ttl
+        self._results = OrderedDict()
+
+    def register(self, mcp):
+        """
+        Expose the stored pages as resources on a FastMCP server.
+
+        Args:
+            mcp: The FastMCP server
+        """
+        mcp.resource(
+            f"{self.scheme}://{{result_id}}/{{page}}",
+            description="One page of a chunked tool result",
+            mime_type="text/plain",
+        )(self.read_page)
+
+    def store(self, text, chunk_size=None):
+        """
+        Split a result into pages and keep them for reading.
+
+        Args:
+            text: The full result text
+            chunk_size: Number of characters per page, defaults to the store's chunk size
+
+        Returns:
+            A manifest to return from the tool in place of the full result
+        """
+        chunk_size = chunk_size or self.chunk_size
+        pages = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)] or [""]
+        result_id = uuid.uuid4().hex
+
+        self._expire()
+        self._results[result_id] = {
+            "pages": pages,
+            "unread": set(range(len(pages))),
+            "expires_at": time.monotonic() + self.ttl,
+        }
+        while len(self._results) > self.max_results:
+            self._results.popitem(last=False)
+
+        return {
+            "chunked_result": {
+                "result_id": result_id,
+                "uri_prefix": f"{self.scheme}://{result_id}/",
+                "pages": len(pages),
+                "chunk_size": chunk_size,
+                "length": len(text),
+            }
+        }
+
+    def read_page(self, result_id: str, page: str) -> str:
+        """ Read one page of a chunked tool result """
+        self._expire()
+        result = self._results.get(result_id)
+        if result is None:
+            raise ValueError(f"Unknown or expired chunked result: {result_id}")
+        pages = result["pages"]
+        index = int(page)
+        if not 0 <= index < len(pages):
+            raise ValueError(f"Page {index} out of range for result {result_id} ({len(pages)} pages)")
+
+        result["unread"].discard(index)
+        if not result["unread"]:
+            self.release(result_id)
+        return pages[index]
+
+    def release(self, result_id):
+        """Drop a stored result."""
+        self._results.pop(result_id, None)
+
+    def _expire(self):
+        """Drop results whose TTL has passed."""
+        now = time.monotonic()
+        expired = [result_id for result_id, result in self._results.items() if result["expires_at"] <= now]
+        for result_id in expired:
+            self.release(result_id)